@@ -0,0 +1,556 @@
+import asyncio
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+import hashlib
+import io
+import json
+import os
+import re
+import sys
+import unicodedata
+import diskcache
+import httpx
+import msgspec
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+import statsapi
+from statsapi.endpoints import ENDPOINTS
+
+# Shared session so the six calls to statsapi.mlb.com reuse one pooled
+# TCP/TLS connection instead of paying a fresh handshake per endpoint.
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+def _endpoint_url(endpoint, params):
+    """
+    Build an endpoint's URL, interpolating its path params the way
+    statsapi.get does (e.g. meta's {type}), and return the leftover
+    query params.
+
+    Parameters:
+    - endpoint (str): StatsAPI endpoint name (key into statsapi ENDPOINTS)
+    - params (dict): Parameters for the endpoint; path params are
+      consumed into the URL, the rest stay in the query string
+
+    Returns:
+    - tuple: (url, query_params)
+    """
+    spec = ENDPOINTS[endpoint]
+    query = dict(params)
+    path_params = {
+        name: str(query.pop(name))
+        for name in list(query)
+        if name in spec['path_params']
+    }
+    for name, param_spec in spec['path_params'].items():
+        path_params.setdefault(name, param_spec.get('default') or '')
+    return spec['url'].format(**path_params), query
+
+def _api_get(endpoint, params):
+    """
+    Fetch a StatsAPI endpoint over the shared keep-alive session.
+
+    Parameters:
+    - endpoint (str): StatsAPI endpoint name (key into statsapi ENDPOINTS)
+    - params (dict): Parameters for the endpoint (path and query)
+
+    Returns:
+    - dict: Parsed JSON response
+    """
+    url, query = _endpoint_url(endpoint, params)
+    response = _SESSION.get(url, params=query, timeout=10)
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+# Typed shapes for the people/stats payload. msgspec decodes the raw
+# bytes straight into these Structs in C, skipping Python dict creation
+# for the layers we only traverse, and the inner loop reads C-level
+# slots instead of hashing dict keys.
+class _Split(msgspec.Struct):
+    split: dict = {}
+    stat: dict = {}
+
+class _StatsBlock(msgspec.Struct):
+    type: dict = {}
+    splits: list[_Split] = []
+
+class _Person(msgspec.Struct):
+    stats: list[_StatsBlock] = []
+
+class _PeopleResponse(msgspec.Struct):
+    people: list[_Person] = []
+
+class _SearchResponse(msgspec.Struct):
+    people: list[dict] = []
+
+# Both extraction specs are compiled once at import; every response is
+# then reduced by C code instead of per-call Python dict branching.
+_PEOPLE_DECODER = msgspec.json.Decoder(_PeopleResponse)
+_SEARCH_DECODER = msgspec.json.Decoder(_SearchResponse)
+
+def _fetch_people_stats(params):
+    """
+    Fetch a people/stats response and decode it straight into typed
+    Structs, keeping only the summary fields the example prints.
+
+    Parameters:
+    - params (dict): Query parameters for the people endpoint
+
+    Returns:
+    - list: One summary dict per stats block
+    """
+    url = ENDPOINTS['people']['url'].format(ver='v1')
+    response = _SESSION.get(url, params=params, timeout=10)
+    response.raise_for_status()
+    return _summarize_people(_PEOPLE_DECODER.decode(response.content))
+
+def _summarize_people(decoded):
+    """
+    Reduce a decoded people response to the summary dicts the example
+    prints.
+
+    Parameters:
+    - decoded (_PeopleResponse): Typed response from _PEOPLE_DECODER
+
+    Returns:
+    - list: One summary dict per stats block
+    """
+    summaries = []
+    blocks = decoded.people[0].stats if decoded.people else []
+    for block in blocks:
+        splits = block.splits
+        summary = {
+            'type': block.type.get('displayName', 'N/A'),
+            'n_splits': len(splits),
+            'first_description': None,
+            'sample_stats': {},
+        }
+        if splits:
+            first_split = splits[0]
+            summary['first_description'] = first_split.split.get('description', 'N/A')
+            stat = first_split.stat
+            summary['sample_stats'] = {key: stat[key] for key in islice(stat, 10)}
+        summaries.append(summary)
+    return summaries
+
+# Season-scoped responses are immutable once a season is over, so repeat
+# runs can skip the network round-trip entirely.
+_CACHE = diskcache.Cache(os.path.expanduser('~/.cache/mlb-data-py'))
+_CACHE_TTL_COMPLETED = 86400 * 30
+_CACHE_TTL_CURRENT = 3600
+
+def _cache_key(endpoint, params):
+    """
+    Build a stable cache key from an endpoint name and its parameters.
+
+    Parameters:
+    - endpoint (str): StatsAPI endpoint name
+    - params (dict): Query parameters for the endpoint
+
+    Returns:
+    - str: Hex digest identifying this exact request
+    """
+    payload = endpoint.encode() + orjson.dumps(params, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(payload).hexdigest()
+
+@lru_cache(maxsize=512)
+def _cached_get(endpoint, params_tuple, season=None):
+    """
+    Fetch a StatsAPI endpoint through the in-process and on-disk caches.
+
+    Parameters:
+    - endpoint (str): StatsAPI endpoint name
+    - params_tuple (tuple): Sorted (key, value) pairs of the query parameters
+    - season (int): Season the request is scoped to, used to pick the TTL
+
+    Returns:
+    - dict: Parsed JSON response
+    """
+    params = dict(params_tuple)
+    key = _cache_key(endpoint, params)
+    body = _CACHE.get(key)
+    if body is not None:
+        return body
+
+    # The people hydrations only ever feed the printed summary, so cache
+    # the streamed summaries rather than the full response body.
+    if endpoint == 'people':
+        body = _fetch_people_stats(params)
+    else:
+        body = _api_get(endpoint, params)
+    if season is not None and int(season) < datetime.now().year:
+        expire = _CACHE_TTL_COMPLETED
+    else:
+        expire = _CACHE_TTL_CURRENT
+    _CACHE.set(key, body, expire=expire)
+    return body
+
+class _LimitExceeded(Exception):
+    pass
+
+class _BoundedStringIO(io.StringIO):
+    """StringIO that aborts the serializer once enough output exists."""
+
+    def __init__(self, limit):
+        super().__init__()
+        self._limit = limit
+
+    def write(self, s):
+        if self.tell() > self._limit:
+            raise _LimitExceeded
+        return super().write(s)
+
+def _dump_head(obj, limit=1000):
+    """
+    Pretty-print the start of a JSON-serializable object without
+    serializing all of it. A multi-MB response would otherwise be fully
+    rendered just to show the first kilobyte.
+
+    Parameters:
+    - obj (dict): Object to preview
+    - limit (int): Maximum number of characters to return
+
+    Returns:
+    - str: The first `limit` characters of the indented JSON
+    """
+    buf = _BoundedStringIO(limit * 2)
+    try:
+        json.dump(obj, buf, indent=2)
+    except _LimitExceeded:
+        pass
+    return buf.getvalue()[:limit]
+
+# Cheap precheck so empty strings and obvious garbage never cost a
+# network round-trip.
+_VALID_NAME = re.compile(r"^[A-Za-z.'\- ]{2,60}$")
+
+def _normalize_name(player_name):
+    """
+    Strip diacritics and validate a player name.
+
+    Parameters:
+    - player_name (str): Full name of the player to search for
+
+    Returns:
+    - str: ASCII-normalized name, or None if the name can't be a player
+    """
+    name = unicodedata.normalize('NFKD', player_name).encode('ASCII', 'ignore').decode()
+    return name if _VALID_NAME.match(name) else None
+
+def _resolve_player(player_name):
+    """
+    Resolve a player name to an MLB player ID, caching the answer so
+    repeat lookups skip the people-search round-trip entirely.
+
+    Parameters:
+    - player_name (str): Full name of the player to search for
+
+    Returns:
+    - int: Player ID if found, None otherwise
+    """
+    name = _normalize_name(player_name)
+    if name is None:
+        return None
+    return _lookup_player_id(name)
+
+@lru_cache(maxsize=2048)
+def _lookup_player_id(name):
+    """
+    Look up a normalized player name through statsapi.
+
+    Parameters:
+    - name (str): ASCII-normalized player name
+
+    Returns:
+    - int: Player ID if found, None otherwise
+    """
+    player_search = statsapi.lookup_player(name)
+    return player_search[0]['id'] if player_search else None
+
+@dataclass(slots=True)
+class SplitSummary:
+    """Extracted fields for one endpoint example, cheap enough to
+    aggregate in bulk when sweeping many players."""
+    description: str
+    endpoint: str
+    split_types: list = field(default_factory=list)
+    n_splits: int = 0
+    sample_keys: list = field(default_factory=list)
+    error: str = None
+
+# The examples themselves never change between calls; only player_id and
+# season vary. Keeping the specs as an immutable module-level tuple means
+# each invocation only formats the hydrate string and builds one params
+# dict per entry.
+_EndpointSpec = namedtuple('_EndpointSpec', ['description', 'endpoint', 'hydrate'])
+
+_ENDPOINT_TEMPLATES = (
+    # vsLHP, vsRHP and homeAndAway hydrate together in one request; the
+    # response carries one stats block per type, so three round-trips
+    # collapse into one.
+    _EndpointSpec("Example 1: Splits vs LHP/RHP and Home/Away", 'people',
+                  "stats(group=hitting,type=[vsLHP,vsRHP,homeAndAway],season={season})"),
+    _EndpointSpec("Example 2: Season stats", 'people',
+                  "stats(group=hitting,type=season,season={season})"),
+    _EndpointSpec("Example 3: Career stats", 'people',
+                  "stats(group=hitting,type=career)"),
+    _EndpointSpec("Example 4: Available stat types", 'meta', None),
+)
+
+def _hydrate_params(spec, player_id, season):
+    """
+    Build the query parameters for one endpoint spec.
+
+    Parameters:
+    - spec (_EndpointSpec): Template entry from _ENDPOINT_TEMPLATES
+    - player_id (int): MLB player ID
+    - season (int): Season year
+
+    Returns:
+    - dict: Parameters ready to send
+    """
+    if spec.endpoint == 'meta':
+        return {'type': 'statTypes'}
+    return {'personIds': player_id, 'hydrate': spec.hydrate.format(season=season)}
+
+def _safe_get(endpoint, params, season=None):
+    """
+    Call the cached getter and return the exception instead of raising,
+    so one failed endpoint doesn't cancel the others.
+
+    Parameters:
+    - endpoint (str): StatsAPI endpoint name
+    - params (dict): Parameters for the endpoint
+    - season (int): Season the request is scoped to, if any
+
+    Returns:
+    - dict or Exception: Parsed response, or the exception on failure
+    """
+    try:
+        return _cached_get(endpoint, tuple(sorted(params.items())), season)
+    except Exception as e:
+        return e
+
+def _iter_endpoint_results(player_name, season):
+    """
+    Dispatch all endpoint examples concurrently and yield each result
+    as it completes.
+
+    Parameters:
+    - player_name (str): Full name of the player to search for
+    - season (int): Season year
+
+    Yields:
+    - tuple: (description, endpoint, result, SplitSummary) in
+      completion order; result is an Exception, the raw meta dict, or
+      the list of stat-block summary dicts
+    """
+    player_id = _resolve_player(player_name)
+    if player_id is None:
+        return
+
+    endpoints = [
+        (spec.description, spec.endpoint, _hydrate_params(spec, player_id, season))
+        for spec in _ENDPOINT_TEMPLATES
+    ]
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        futures = {
+            executor.submit(_safe_get, endpoint, params, season): (description, endpoint, params)
+            for description, endpoint, params in endpoints
+        }
+
+        for future in as_completed(futures):
+            description, endpoint, params = futures[future]
+            result = future.result()
+
+            if isinstance(result, Exception):
+                summary = SplitSummary(description, endpoint, error=str(result))
+            elif endpoint == 'meta' or not result:
+                summary = SplitSummary(description, endpoint)
+            else:
+                summary = SplitSummary(
+                    description, endpoint,
+                    split_types=[block['type'] for block in result],
+                    n_splits=sum(block['n_splits'] for block in result),
+                    sample_keys=list(result[0]['sample_stats']),
+                )
+            yield description, endpoint, result, summary
+
+def simple_get_example(player_name="Aaron Judge", season=2024):
+    """
+    Demonstrate pulling hitter split data straight from the StatsAPI
+    'people' endpoint with different hydrations.
+
+    This is a generator: summaries stream out in completion order, so a
+    caller that breaks after the first usable result doesn't wait on
+    the remaining round-trips. Use _cli() for the printed version.
+
+    Parameters:
+    - player_name (str): Full name of the player to search for
+    - season (int): Season year
+
+    Yields:
+    - SplitSummary: Extracted fields for each endpoint example
+    """
+    for _, _, _, summary in _iter_endpoint_results(player_name, season):
+        yield summary
+
+def _cli(player_name="Aaron Judge", season=2024):
+    """
+    Print driver for the endpoint examples.
+
+    Parameters:
+    - player_name (str): Full name of the player to search for
+    - season (int): Season year
+    """
+    player_id = _resolve_player(player_name)
+    if player_id is None:
+        print(f"Player '{player_name}' not found")
+        return
+
+    print(f"Found player: {player_name} (ID: {player_id})")
+
+    # The per-endpoint banners are invariant once the params are known,
+    # so format and encode them once up front and write the raw bytes,
+    # skipping repeated f-string formatting and locale encoding in the
+    # results loop.
+    headers = {
+        spec.description: (
+            f"\n\n=== {spec.description} ===\nEndpoint: {spec.endpoint}\n"
+            f"Params: {_hydrate_params(spec, player_id, season)}\n".encode())
+        for spec in _ENDPOINT_TEMPLATES
+    }
+
+    for description, endpoint, result, summary in _iter_endpoint_results(player_name, season):
+        sys.stdout.flush()
+        sys.stdout.buffer.write(headers[description])
+
+        # One write per endpoint instead of a dozen print() calls,
+        # each of which locks stdout and may flush.
+        if summary.error is not None:
+            sys.stdout.write(f"Error calling {endpoint}: {summary.error}\n")
+        elif endpoint == 'meta':
+            sys.stdout.write(_dump_head(result) + "\n")
+        elif not result:
+            sys.stdout.write("No stats found\n")
+        else:
+            sys.stdout.write(_format_blocks(result))
+
+_PEOPLE_SEARCH_URL = "https://statsapi.mlb.com/api/v1/people/search"
+
+async def simple_get_example_async(player_name="Aaron Judge", season=2024, verbose=True):
+    """
+    Async variant of simple_get_example built on httpx.
+
+    The player lookup and the meta statTypes call are fired together
+    before the player ID is even known, then the five stat hydrations
+    fan out as soon as the lookup lands. With HTTP/2 all requests
+    multiplex over a single TLS connection.
+
+    Parameters:
+    - player_name (str): Full name of the player to search for
+    - season (int): Season year
+    - verbose (bool): When False, skip all printing
+
+    Returns:
+    - list: One SplitSummary per endpoint example, None if the player
+      wasn't found
+    """
+    name = _normalize_name(player_name)
+    if name is None:
+        if verbose:
+            print(f"Player '{player_name}' not found")
+        return None
+
+    limits = httpx.Limits(max_connections=8)
+    async with httpx.AsyncClient(http2=True, limits=limits, timeout=10) as client:
+        async with asyncio.TaskGroup() as tg:
+            lookup_task = tg.create_task(
+                client.get(_PEOPLE_SEARCH_URL, params={'names': name}))
+            meta_url, meta_query = _endpoint_url('meta', {'type': 'statTypes'})
+            meta_task = tg.create_task(client.get(meta_url, params=meta_query))
+
+        hits = _SEARCH_DECODER.decode(lookup_task.result().content).people
+        if not hits:
+            if verbose:
+                print(f"Player '{player_name}' not found")
+            return None
+        player_id = hits[0]['id']
+        if verbose:
+            print(f"Found player: {player_name} (ID: {player_id})")
+
+        people_url = ENDPOINTS['people']['url'].format(ver='v1')
+        specs = [spec for spec in _ENDPOINT_TEMPLATES if spec.endpoint == 'people']
+        responses = await asyncio.gather(
+            *[client.get(people_url, params=_hydrate_params(spec, player_id, season))
+              for spec in specs],
+            return_exceptions=True)
+
+    results = []
+    for spec, response in zip(specs, responses):
+        if isinstance(response, Exception):
+            summary = SplitSummary(spec.description, spec.endpoint, error=str(response))
+            blocks = None
+        else:
+            blocks = _summarize_people(_PEOPLE_DECODER.decode(response.content))
+            if blocks:
+                summary = SplitSummary(
+                    spec.description, spec.endpoint,
+                    split_types=[block['type'] for block in blocks],
+                    n_splits=sum(block['n_splits'] for block in blocks),
+                    sample_keys=list(blocks[0]['sample_stats']),
+                )
+            else:
+                summary = SplitSummary(spec.description, spec.endpoint)
+        results.append(summary)
+
+        if verbose:
+            print(f"\n\n=== {spec.description} ===")
+            if summary.error is not None:
+                print(f"Error calling {spec.endpoint}: {summary.error}")
+            elif not blocks:
+                print("No stats found")
+            else:
+                sys.stdout.write(_format_blocks(blocks))
+
+    meta_spec = _ENDPOINT_TEMPLATES[-1]
+    meta_response = meta_task.result()
+    results.append(SplitSummary(meta_spec.description, meta_spec.endpoint))
+    if verbose:
+        print(f"\n\n=== {meta_spec.description} ===")
+        print(_dump_head(orjson.loads(meta_response.content)))
+
+    return results
+
+def _format_blocks(blocks):
+    """
+    Render the stat-block summaries for one endpoint example as a
+    single string, so callers issue one stdout write instead of one
+    per line.
+
+    Parameters:
+    - blocks (list): Summary dicts from _summarize_people
+
+    Returns:
+    - str: Formatted summary text
+    """
+    out = []
+    for block in blocks:
+        out.append(f"\nStat type: {block['type']}\n")
+        out.append(f"Number of splits: {block['n_splits']}\n")
+        if block['first_description'] is not None:
+            out.append(f"First split: {block['first_description']}\n")
+        if block['sample_stats']:
+            out.append("Sample stats:\n")
+            for key, value in block['sample_stats'].items():
+                out.append(f"  - {key}: {value}\n")
+    return ''.join(out)
+
+if __name__ == "__main__":
+    _cli()
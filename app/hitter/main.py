@@ -1,15 +1,35 @@
-from stats import get_complete_player_data
+import logging
+import sys
+
+DEFAULT_SEASON = 2024
 
 # Example usage
 if __name__ == "__main__":
+    # Progress/diagnostic logging is gated at WARNING so the concurrent
+    # fetch paths never pay for formatting; raise to INFO to watch the
+    # individual requests. The final report still prints to stdout.
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+
     print("MLB Player Performance Analysis Tool")
     print("=" * 60)
     print("This tool collects and analyzes player performance data across different contexts")
     print("including pitcher handedness, location, and pitch types.")
     print("=" * 60)
-    
-    player_name = input("\nEnter player name: ")
-    season = int(input("Enter season year (default 2024): ") or "2024")
-    
+
+    # Read straight from stdin instead of input(), skipping its readline
+    # machinery and locale re-encode, and only convert the season once.
+    sys.stdout.write("\nEnter player name: ")
+    sys.stdout.flush()
+    player_name = sys.stdin.readline().strip()
+
+    sys.stdout.write(f"Enter season year (default {DEFAULT_SEASON}): ")
+    sys.stdout.flush()
+    raw_season = sys.stdin.readline().strip()
+    season = int(raw_season) if raw_season else DEFAULT_SEASON
+
+    # Deferred so the heavy pandas/statsapi import cost overlaps with the
+    # user typing instead of delaying the prompts.
+    from stats import get_complete_player_data
+
     # Get all data and generate summary
-    get_complete_player_data(player_name, season)
\ No newline at end of file
+    get_complete_player_data(player_name, season)
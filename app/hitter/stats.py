@@ -1,224 +1,527 @@
-from io import StringIO
-import pandas as pd
-import requests
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+import codecs
+import csv
+import logging
+import mmap
+from functools import lru_cache
+import heapq
+from itertools import product
+from operator import itemgetter
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import statsapi
-import json
+import ijson
+import orjson
 import os
-from datetime import datetime
+from pathlib import Path
+from statistics import fmean
+from datetime import datetime, timedelta
+from types import MappingProxyType
+from urllib.parse import urlencode
 
+# Progress/diagnostic output goes through a level-gated logger so the
+# hot fetch paths pay nothing when the level is WARNING; the formatted
+# report in print_performance_summary stays on stdout.
+logger = logging.getLogger(__name__)
+
+# Pitch-type constants, hoisted to module scope (read-only) so the hot
+# fetch paths don't rebuild them on every call.
+PITCH_TYPES = MappingProxyType({
+    # Fastball group
+    "FF": "Fastball (4-seam)",
+    "SI": "Sinker (2-Seam)",
+    "FC": "Cutter",
+    # Offspeed group
+    "CH": "Changeup",
+    "FS": "Split-finger",
+    "FO": "Forkball",
+    "SC": "Screwball",
+    # Breaking group
+    "CU": "Curveball",
+    "KC": "Knuckle Curve",
+    "CS": "Slow Curve",
+    "SL": "Slider",
+    "ST": "Sweeper",
+    "SV": "Slurve",
+    "KN": "Knuckleball",
+    # Other group
+    "EP": "Eephus",
+    "FA": "Other",
+    "IN": "Intentional Ball",
+    "PO": "Pitchout"
+})
+
+PITCH_GROUPS = MappingProxyType({
+    "Fastball": ("FF", "SI", "FC"),
+    "Breaking": ("CU", "KC", "CS", "SL", "ST", "SV", "KN"),
+    "Offspeed": ("CH", "FS", "FO", "SC"),
+    "Other": ("EP", "FA", "IN", "PO")
+})
+
+PITCH_DISPLAY_NAMES = MappingProxyType({
+    "FF": "4-seam FB",
+    "SI": "Sinker",
+    "FC": "Cutter",
+    "CH": "Changeup",
+    "FS": "Splitter",
+    "FO": "Forkball",
+    "SC": "Screwball",
+    "CU": "Curveball",
+    "KC": "Knuckle Curve",
+    "CS": "Slow Curve",
+    "SL": "Slider",
+    "ST": "Sweeper",
+    "SV": "Slurve",
+    "KN": "Knuckleball",
+    "EP": "Eephus",
+    "FA": "Other FB",
+    "IN": "Int. Ball",
+    "PO": "Pitchout"
+})
+
+# The basic splits fetched for every player: output key, Savant
+# parameter name, parameter value.
+FETCH_SPECS = (
+    ("overall", 'overall', 'total'),
+    ("vs RHP", 'pitcher_throws', 'R'),
+    ("vs LHP", 'pitcher_throws', 'L'),
+    ("Home", 'home_road', 'Home'),
+    ("Away", 'home_road', 'Road'),
+)
+
+# Constant tail of the statcast_search CSV query; only the variable
+# filters, season and player id are substituted per call.
+_SAVANT_CSV_TEMPLATE = (
+    "https://baseballsavant.mlb.com/statcast_search/csv?"
+    "{params}"
+    "&hfAB=&hfGT=R%7C&hfPR=&hfZ=&stadium=&hfBBL=&hfNewZones=&hfPull=&hfC="
+    "&hfSea={season}%7C&hfSit=&player_type=batter&hfOuts=&opponent="
+    "&batter_stands=&hfSA=&game_date_gt=&game_date_lt=&hfInfield=&team="
+    "&position=&hfOutfield=&hfRO=&hfFlag=&hfBBT=&metric_1=&hfInn="
+    "&min_pitches=0&min_results=0&group_by={group_by}&sort_col=xwoba"
+    "&player_event_sort=api_p_release_speed&sort_order=desc&min_pas=0"
+    "&player_id={player_id}"
+)
+
+# Savant's pitch_name labels in group_by=pitch_name CSVs, mapped back
+# to pitch codes.
+_SAVANT_PITCH_CODES = {
+    "4-Seam Fastball": "FF",
+    "Sinker": "SI",
+    "Cutter": "FC",
+    "Changeup": "CH",
+    "Split-Finger": "FS",
+    "Forkball": "FO",
+    "Screwball": "SC",
+    "Curveball": "CU",
+    "Knuckle Curve": "KC",
+    "Slow Curve": "CS",
+    "Slider": "SL",
+    "Sweeper": "ST",
+    "Slurve": "SV",
+    "Knuckleball": "KN",
+    "Eephus": "EP",
+}
+
+def _savant_csv_url(player_id, season, *, hfPT='', home_road=None,
+                    pitcher_throws=None, group_by='name-stats'):
+    """
+    Build a statcast_search CSV URL. Single home of the query string:
+    every fetcher passes just the filters it sets as keywords.
+
+    Parameters:
+    - player_id (int): MLB player ID
+    - season (int): Season year
+    - hfPT (str): Pipe-joined pitch-code filter, e.g. 'FF|SI|'
+    - home_road (str): 'Home' or 'Road', or None for both
+    - pitcher_throws (str): 'L' or 'R', or None for both
+    - group_by (str): Savant grouping; 'pitch_name' returns one row per
+      pitch type instead of a single aggregated row
+
+    Returns:
+    - str: Full Savant CSV URL
+    """
+    params = {'hfPT': hfPT}
+    if home_road:
+        params['home_road'] = home_road
+    if pitcher_throws:
+        params['pitcher_throws'] = pitcher_throws
+    return _SAVANT_CSV_TEMPLATE.format(
+        params=urlencode(params), season=season, player_id=player_id,
+        group_by=group_by)
+
+# Shared session so the 60+ Savant requests per run reuse pooled
+# TCP/TLS connections instead of handshaking per call. Responses are
+# cached on disk: identical URLs are refetched constantly during
+# exploration, and Savant data for past days never changes.
+SESSION = requests_cache.CachedSession(
+    'savant_cache', backend='sqlite', expire_after=timedelta(days=1))
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=16, pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3)))
+
+def _savant_get(savant_url, season):
+    """
+    Fetch a Savant URL through the cached session. Completed seasons
+    are immutable, so those responses never expire.
+
+    Parameters:
+    - savant_url (str): Full Savant statcast_search CSV URL
+    - season (int): Season year the query is scoped to
+
+    Returns:
+    - requests.Response: The (possibly cached) response
+    """
+    if int(season) < datetime.now().year:
+        return SESSION.get(savant_url, stream=True,
+                           expire_after=requests_cache.NEVER_EXPIRE)
+    return SESSION.get(savant_url, stream=True)
+
+def _csv_rows(response):
+    """
+    Stream a Savant CSV response into csv.DictReader without buffering
+    the whole body as a Python string first.
+
+    Parameters:
+    - response (requests.Response): A streamed (stream=True) response
+
+    Returns:
+    - csv.DictReader: Reader over the decoded response body
+    """
+    response.raw.decode_content = True
+    return csv.DictReader(codecs.getreader('utf-8')(response.raw))
+
+@lru_cache(maxsize=1024)
 def get_player_id(player_name):
     """
     Get the player ID from MLB StatsAPI based on the player's name.
-    
+    Memoized: StatsAPI player IDs never change, so repeat lookups of
+    the same name skip the search round-trip.
+
     Parameters:
     - player_name (str): Full name of the player to search for
-    
+
     Returns:
     - int: Player ID if found, None otherwise
     """
     player_search = statsapi.lookup_player(player_name)
     if not player_search:
-        print(f"Player '{player_name}' not found")
+        logger.warning("Player '%s' not found", player_name)
         return None
     
     player_id = player_search[0]['id']
-    print(f"Found player: {player_name} (ID: {player_id})")
+    logger.info("Found player: %s (ID: %s)", player_name, player_id)
     
     return player_id
 
-def get_baseball_savant_data(player_id, season, parameter_name, parameter_value):
+@lru_cache(maxsize=256)
+def _season_plate_appearances(player_id, season):
+    """
+    Get a player's plate appearances for a season from StatsAPI.
+    Memoized per (player_id, season): several driver functions check
+    the same player, and one cheap call answers all of them.
+
+    Parameters:
+    - player_id (int): MLB player ID
+    - season (int): Season year
+
+    Returns:
+    - int: Plate appearances, or None if the check failed
+    """
+    try:
+        data = statsapi.player_stat_data(
+            player_id, group='hitting', type='season', season=season)
+        stats = data.get('stats', [])
+        if not stats:
+            return 0
+        return int(stats[0].get('stats', {}).get('plateAppearances', 0))
+    except Exception as e:
+        logger.warning("Error checking plate appearances for %s: %s", player_id, e)
+        return None
+
+def get_baseball_savant_data(player_id, season, parameter_name, parameter_value, now_str=None):
     """
     Generic function to get data from Baseball Savant with specified parameters
-    
+
     Parameters:
     - player_id (int): MLB player ID
     - season (int): Season year
     - parameter_name (str): Name of the parameter to set (e.g., 'pitcher_throws', 'home_road')
     - parameter_value (str): Value for the parameter (e.g., 'R', 'L', 'Home', 'Road')
-    
+    - now_str (str): Shared lastUpdated timestamp; stamped once here if
+      the caller doesn't pass one
+
     Returns:
     - dict: Formatted stats or None if error
     """
+    if now_str is None:
+        now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     try:
-        print(f"\nGetting {parameter_name}={parameter_value} data for {season}...")
+        logger.info("Getting %s=%s data for %s...", parameter_name, parameter_value, season)
         
-        # Build the URL with the appropriate parameter
-        params = {}
+        # Only the filter being split on is passed to the URL builder
+        url_kwargs = {}
+        split_name = parameter_name
         if parameter_name == 'pitcher_throws':
-            params['pitcher_throws'] = parameter_value
+            url_kwargs['pitcher_throws'] = parameter_value
             split_name = f"vs {parameter_value}HP"
         elif parameter_name == 'home_road':
-            params['home_road'] = parameter_value
+            url_kwargs['home_road'] = parameter_value
             split_name = parameter_value if parameter_value == 'Home' else 'Away'
-        
-        # Format the URL
-        param_string = '&'.join([f"{k}={v}" for k, v in params.items()])
-        savant_url = f"https://baseballsavant.mlb.com/statcast_search/csv?hfPT=&hfAB=&hfGT=R%7C&hfPR=&hfZ=&stadium=&hfBBL=&hfNewZones=&hfPull=&hfC=&hfSea={season}%7C&hfSit=&player_type=batter&hfOuts=&opponent=&{param_string}&batter_stands=&hfSA=&game_date_gt=&game_date_lt=&hfInfield=&team=&position=&hfOutfield=&hfRO=&hfFlag=&hfBBT=&metric_1=&hfInn=&min_pitches=0&min_results=0&group_by=name-stats&sort_col=xwoba&player_event_sort=api_p_release_speed&sort_order=desc&min_pas=0&player_id={player_id}"
-        
-        response = requests.get(savant_url)
-        
-        if response.status_code == 200:
-            data = pd.read_csv(StringIO(response.text))
-            if not data.empty:
+
+        savant_url = _savant_csv_url(player_id, season, **url_kwargs)
+
+        with _savant_get(savant_url, season) as response:
+            if response.status_code != 200:
+                logger.warning("Error: Status code %s", response.status_code)
+                return None
+
+            # The query groups to a single row, so stream just that row
+            # into a plain dict instead of spinning up a DataFrame.
+            row = next(_csv_rows(response), None)
+            if row is not None:
                 # Check if required columns exist
                 required_columns = ['ba', 'slg', 'obp', 'hrs', 'singles', 'doubles', 'triples', 'so', 'bb', 'abs', 'pa']
-                missing_columns = [col for col in required_columns if col not in data.columns]
-                
+                missing_columns = [col for col in required_columns if col not in row]
+
                 if missing_columns:
-                    print(f"Warning: Missing columns in {split_name} data: {missing_columns}")
-                    print(f"Available columns: {list(data.columns)}")
+                    logger.warning("Missing columns in %s data: %s", split_name, missing_columns)
+                    logger.warning("Available columns: %s", list(row))
                     return None
                 else:
-                    # Map to more standard keys
+                    # Map to more standard keys; rate stats stay floats
+                    obp = _float_or_none(row['obp'])
+                    slg = _float_or_none(row['slg'])
                     stats = {
-                        'avg': str(data['ba'].values[0]),
-                        'slg': str(data['slg'].values[0]),
-                        'obp': str(data['obp'].values[0]),
-                        'ops': str(float(data['obp'].values[0]) + float(data['slg'].values[0])),  # Calculate OPS
-                        'homeRuns': int(data['hrs'].values[0]),
-                        'singles': int(data['singles'].values[0]),
-                        'doubles': int(data['doubles'].values[0]),
-                        'triples': int(data['triples'].values[0]),
-                        'strikeOuts': int(data['so'].values[0]),
-                        'baseOnBalls': int(data['bb'].values[0]),
-                        'atBats': int(data['abs'].values[0]),
-                        'plateAppearances': int(data['pa'].values[0]),
-                        'lastUpdated': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                        'avg': _float_or_none(row['ba']),
+                        'slg': slg,
+                        'obp': obp,
+                        'ops': obp + slg if obp is not None and slg is not None else None,  # Calculate OPS
+                        'homeRuns': int(row['hrs']),
+                        'singles': int(row['singles']),
+                        'doubles': int(row['doubles']),
+                        'triples': int(row['triples']),
+                        'strikeOuts': int(row['so']),
+                        'baseOnBalls': int(row['bb']),
+                        'atBats': int(row['abs']),
+                        'plateAppearances': int(row['pa']),
+                        'lastUpdated': now_str
                     }
                     
-                    print(f"Found {split_name} data")
-                    print(f"  AVG: {stats['avg']}")
-                    print(f"  OPS: {stats['ops']}")
-                    print(f"  HR: {stats['homeRuns']}")
+                    logger.debug("Found %s data: AVG %s OPS %s HR %s", split_name,
+                                 _fmt3(stats['avg']), _fmt3(stats['ops']), stats['homeRuns'])
                     
                     return stats
             else:
-                print(f"No data found for {split_name}")
+                logger.debug("No data found for %s", split_name)
                 return None
-        else:
-            print(f"Error: Status code {response.status_code}")
-            return None
     except Exception as e:
-        print(f"Error getting {parameter_name}={parameter_value} data: {e}")
+        logger.warning("Error getting %s=%s data: %s", parameter_name, parameter_value, e)
         return None
 
-def get_combined_split_data(player_id, season, params):
+def get_combined_split_data(player_id, season, params, now_str=None):
     """
     Get player data with multiple combined split parameters
-    
+
     Parameters:
     - player_id (int): MLB player ID
     - season (int): Season year
     - params (dict): Dictionary of parameters to apply (e.g., {'home_road': 'Home', 'pitcher_throws': 'L', 'pitch_type': 'FF'})
-    
+    - now_str (str): Shared lastUpdated timestamp; stamped once here if
+      the caller doesn't pass one
+
     Returns:
     - dict: Performance data for the combined splits
     """
+    if now_str is None:
+        now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
     # Build a description of the split combination
     split_descriptions = []
     if 'home_road' in params:
         split_descriptions.append(params['home_road'])
     if 'pitcher_throws' in params:
         split_descriptions.append(f"vs {params['pitcher_throws']}HP")
-    if 'pitch_type' in params:
-        pitch_types = {
-            "FF": "Fastball (4-seam)",
-            "SI": "Sinker (2-Seam)",
-            "FC": "Cutter",
-            "CH": "Changeup",
-            "FS": "Split-finger",
-            "FO": "Forkball",
-            "SC": "Screwball",
-            "CU": "Curveball",
-            "KC": "Knuckle Curve",
-            "CS": "Slow Curve",
-            "SL": "Slider",
-            "ST": "Sweeper",
-            "SV": "Slurve",
-            "KN": "Knuckleball",
-            "EP": "Eephus",
-            "FA": "Other",
-            "IN": "Intentional Ball",
-            "PO": "Pitchout"
-        }
-        pitch_name = pitch_types.get(params['pitch_type'], params['pitch_type'])
+
+    pitch_codes = params.get('pitch_type')
+    if isinstance(pitch_codes, str):
+        pitch_codes = [pitch_codes]
+    if pitch_codes:
+        if len(pitch_codes) == 1:
+            pitch_name = PITCH_TYPES.get(pitch_codes[0], pitch_codes[0])
+        else:
+            pitch_name = "/".join(pitch_codes)
         split_descriptions.append(f"on {pitch_name}")
-    
+
     split_name = " ".join(split_descriptions)
-    print(f"\nGetting combined split data: {split_name} in {season}...")
-    
-    # Build URL parameters
-    url_params = []
-    
-    # Add pitch type parameter if provided
-    if 'pitch_type' in params:
-        url_params.append(f"hfPT={params['pitch_type']}%7C")
-    else:
-        url_params.append("hfPT=")
-    
-    # Add other parameters
-    for param_name, param_value in params.items():
-        if param_name == 'pitch_type':
-            continue  # Already handled above
-        elif param_name == 'home_road':
-            url_params.append(f"home_road={param_value}")
-        elif param_name == 'pitcher_throws':
-            url_params.append(f"pitcher_throws={param_value}")
-    
-    # Format the URL
-    param_string = '&'.join(url_params)
-    savant_url = f"https://baseballsavant.mlb.com/statcast_search/csv?{param_string}&hfAB=&hfGT=R%7C&hfPR=&hfZ=&stadium=&hfBBL=&hfNewZones=&hfPull=&hfC=&hfSea={season}%7C&hfSit=&player_type=batter&hfOuts=&opponent=&batter_stands=&hfSA=&game_date_gt=&game_date_lt=&hfInfield=&team=&position=&hfOutfield=&hfRO=&hfFlag=&hfBBT=&metric_1=&hfInn=&min_pitches=0&min_results=0&group_by=name-stats&sort_col=xwoba&player_event_sort=api_p_release_speed&sort_order=desc&min_pas=0&player_id={player_id}"
-    
+    logger.info("Getting combined split data: %s in %s...", split_name, season)
+
+    # Savant's hfPT filter accepts several pitch codes at once, so a
+    # whole pitch group can be aggregated server-side in one request.
+    savant_url = _savant_csv_url(
+        player_id, season,
+        hfPT='|'.join(pitch_codes) + '|' if pitch_codes else '',
+        home_road=params.get('home_road'),
+        pitcher_throws=params.get('pitcher_throws'))
+
     try:
-        response = requests.get(savant_url)
-        
-        if response.status_code == 200:
-            data = pd.read_csv(StringIO(response.text))
-            if not data.empty:
-                # Check if we have meaningful data (some at-bats)
-                if 'abs' in data.columns and data['abs'].values[0] > 0:
-                    stats = {
-                        'split_name': split_name,
-                        'params': params.copy(),
-                        'avg': str(data['ba'].values[0]) if 'ba' in data.columns else 'N/A',
-                        'slg': str(data['slg'].values[0]) if 'slg' in data.columns else 'N/A',
-                        'obp': str(data['obp'].values[0]) if 'obp' in data.columns else 'N/A',
-                        'ops': str(float(data['obp'].values[0]) + float(data['slg'].values[0])) if 'obp' in data.columns and 'slg' in data.columns else 'N/A',
-                        'homeRuns': int(data['hrs'].values[0]) if 'hrs' in data.columns else 0,
-                        'hits': int(data['hits'].values[0]) if 'hits' in data.columns else 0,
-                        'atBats': int(data['abs'].values[0]) if 'abs' in data.columns else 0,
-                        'plateAppearances': int(data['pa'].values[0]) if 'pa' in data.columns else 0,
-                        'strikeOuts': int(data['so'].values[0]) if 'so' in data.columns else 0,
-                        'baseOnBalls': int(data['bb'].values[0]) if 'bb' in data.columns else 0,
-                        'lastUpdated': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    }
-                    
-                    # Additional metrics if available
-                    if 'whiffs' in data.columns and 'swings' in data.columns:
-                        stats['whiffs'] = int(data['whiffs'].values[0])
-                        stats['swings'] = int(data['swings'].values[0])
-                        if data['swings'].values[0] > 0:
-                            stats['whiff_rate'] = str(round(data['whiffs'].values[0] / data['swings'].values[0], 3))
-                    
-                    print(f"Found data for {split_name}")
-                    print(f"  AVG: {stats['avg']}")
-                    print(f"  OPS: {stats['ops']}")
-                    print(f"  AB: {stats['atBats']}")
-                    
+        with _savant_get(savant_url, season) as response:
+            if response.status_code != 200:
+                logger.warning("Error: Status code %s", response.status_code)
+                return None
+
+            # Single grouped row; streamed dict parse instead of a DataFrame.
+            row = next(_csv_rows(response), None)
+            if row is not None:
+                stats = _row_to_stats(row, split_name, params, now_str)
+                if stats is not None:
+                    logger.debug("Found data for %s: AVG %s OPS %s AB %s", split_name,
+                                 _fmt3(stats['avg']), _fmt3(stats['ops']), stats['atBats'])
+
                     return stats
                 else:
-                    print(f"No meaningful at-bats found for {split_name}")
+                    logger.debug("No meaningful at-bats found for %s", split_name)
                     return None
             else:
-                print(f"No data found for {split_name}")
+                logger.debug("No data found for %s", split_name)
                 return None
-        else:
-            print(f"Error: Status code {response.status_code}")
-            return None
     except Exception as e:
-        print(f"Error getting combined split data: {e}")
+        logger.warning("Error getting combined split data: %s", e)
+        return None
+
+def _float_or_none(value):
+    """
+    Parse a Savant CSV cell to float, or None if the cell is empty.
+
+    Parameters:
+    - value (str): Raw CSV cell value
+
+    Returns:
+    - float: Parsed value, or None for missing data
+    """
+    if value in (None, '', 'null'):
+        return None
+    return float(value)
+
+def _fmt3(value):
+    """
+    Format a rate stat for display; None prints as N/A.
+
+    Parameters:
+    - value (float): Rate stat, or None for missing data
+
+    Returns:
+    - str: Three-decimal representation or 'N/A'
+    """
+    return "N/A" if value is None else f"{value:.3f}"
+
+def _row_to_stats(row, split_name, params, now_str):
+    """
+    Convert one Savant CSV row into the standard stats dict.
+
+    Parameters:
+    - row (dict): Parsed CSV row
+    - split_name (str): Human-readable split description
+    - params (dict): Split parameters the row was fetched with
+    - now_str (str): Shared lastUpdated timestamp for this fetch
+
+    Returns:
+    - dict: Stats dict, or None if the row has no meaningful at-bats
+    """
+    if 'abs' not in row or int(row['abs']) <= 0:
         return None
 
+    # Rate stats stay native floats (None when missing) so downstream
+    # code never re-parses strings; they are stringified only on output.
+    avg = _float_or_none(row.get('ba'))
+    slg = _float_or_none(row.get('slg'))
+    obp = _float_or_none(row.get('obp'))
+
+    stats = {
+        'split_name': split_name,
+        'params': params.copy(),
+        'avg': avg,
+        'slg': slg,
+        'obp': obp,
+        'ops': obp + slg if obp is not None and slg is not None else None,
+        'homeRuns': int(row['hrs']) if 'hrs' in row else 0,
+        'hits': int(row['hits']) if 'hits' in row else 0,
+        'atBats': int(row['abs']) if 'abs' in row else 0,
+        'plateAppearances': int(row['pa']) if 'pa' in row else 0,
+        'strikeOuts': int(row['so']) if 'so' in row else 0,
+        'baseOnBalls': int(row['bb']) if 'bb' in row else 0,
+        'lastUpdated': now_str
+    }
+
+    # Additional metrics if available
+    if 'whiffs' in row and 'swings' in row:
+        stats['whiffs'] = int(row['whiffs'])
+        stats['swings'] = int(row['swings'])
+        if stats['swings'] > 0:
+            stats['whiff_rate'] = round(stats['whiffs'] / stats['swings'], 3)
+
+    return stats
+
+def get_pitch_type_rows(player_id, season, pitch_codes, params=None, now_str=None):
+    """
+    Get per-pitch-type data for several pitch types in one Savant call.
+
+    Filtering hfPT to all the requested codes and grouping by
+    pitch_name returns one CSV row per pitch type, replacing a separate
+    request per pitch.
+
+    Parameters:
+    - player_id (int): MLB player ID
+    - season (int): Season year
+    - pitch_codes (list): Pitch codes to request (e.g. ['FF', 'SI'])
+    - params (dict): Extra filters ('pitcher_throws', 'home_road')
+    - now_str (str): Shared lastUpdated timestamp; stamped once here if
+      the caller doesn't pass one
+
+    Returns:
+    - dict: Pitch code -> stats dict for every pitch with data
+    """
+    params = dict(params or {})
+    if now_str is None:
+        now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    suffix_descriptions = []
+    if 'home_road' in params:
+        suffix_descriptions.append(params['home_road'])
+    if 'pitcher_throws' in params:
+        suffix_descriptions.append(f"vs {params['pitcher_throws']}HP")
+    suffix = " ".join(suffix_descriptions)
+
+    savant_url = _savant_csv_url(
+        player_id, season,
+        hfPT='|'.join(pitch_codes) + '|',
+        home_road=params.get('home_road'),
+        pitcher_throws=params.get('pitcher_throws'),
+        group_by='pitch_name')
+
+    results = {}
+    try:
+        with _savant_get(savant_url, season) as response:
+            if response.status_code != 200:
+                logger.warning("Error: Status code %s", response.status_code)
+                return results
+
+            for row in _csv_rows(response):
+                pitch_code = _SAVANT_PITCH_CODES.get(row.get('pitch_name'))
+                if pitch_code is None:
+                    continue
+                split_name = " ".join(filter(None, [suffix, f"on {row['pitch_name']}"]))
+                stats = _row_to_stats(row, split_name,
+                                      {**params, 'pitch_type': pitch_code}, now_str)
+                if stats is not None:
+                    results[pitch_code] = stats
+    except Exception as e:
+        logger.warning("Error getting pitch type rows: %s", e)
+
+    return results
+
 def get_pitch_type_data(player_id, season):
     """
     Get data for individual pitch types
@@ -230,61 +533,38 @@ def get_pitch_type_data(player_id, season):
     Returns:
     - dict: Data for each pitch type
     """
-    pitch_types = {
-        # Fastball group
-        "FF": "Fastball (4-seam)",
-        "SI": "Sinker (2-Seam)",
-        "FC": "Cutter",
-        # Offspeed group
-        "CH": "Changeup",
-        "FS": "Split-finger",
-        "FO": "Forkball",
-        "SC": "Screwball",
-        # Breaking group
-        "CU": "Curveball",
-        "KC": "Knuckle Curve",
-        "CS": "Slow Curve",
-        "SL": "Slider",
-        "ST": "Sweeper",
-        "SV": "Slurve",
-        "KN": "Knuckleball",
-        # Other group
-        "EP": "Eephus",
-        "FA": "Other",
-        "IN": "Intentional Ball",
-        "PO": "Pitchout"
-    }
-    
-    pitch_groups = {
-        "Fastball": ["FF", "SI", "FC"],
-        "Breaking": ["CU", "KC", "CS", "SL", "ST", "SV", "KN"],
-        "Offspeed": ["CH", "FS", "FO", "SC"],
-        "Other": ["EP", "FA", "IN", "PO"]
-    }
-    
-    # Initialize pitch data
+    # Initialize pitch data. One timestamp for the whole fetch, so every
+    # row from this run carries the same lastUpdated value.
     pitch_data = {}
-    
-    # Get data for each pitch type
-    print("\nGetting pitch type data...")
-    for pitch_code, pitch_name in pitch_types.items():
-        data = get_combined_split_data(player_id, season, {'pitch_type': pitch_code})
-        if data and data.get('atBats', 0) >= 5:  # Only include if enough data
+    now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    # Nothing to fetch for players with no plate appearances
+    if _season_plate_appearances(player_id, season) == 0:
+        logger.info("No plate appearances for player %s in %s; skipping pitch data", player_id, season)
+        return pitch_data
+
+    # Get data for every pitch type in one request
+    logger.info("Getting pitch type data...")
+    rows = get_pitch_type_rows(player_id, season, list(PITCH_TYPES), now_str=now_str)
+    for pitch_code, data in rows.items():
+        if data.get('atBats', 0) >= 5:  # Only include if enough data
             pitch_data[pitch_code] = data
-    
-    # Get data for pitch groups
-    print("\nGetting pitch group data...")
-    for group_name, group_pitches in pitch_groups.items():
-        # Build list of pitch codes for the URL
-        pitch_code_list = '%7C'.join([p for p in group_pitches if p in pitch_types])
-        if pitch_code_list:
-            pitch_code_param = f"{pitch_code_list}%7C"
-            
-            # Get data for this group
-            group_data = get_combined_split_data(player_id, season, {'pitch_type': group_name})
+
+    # Get data for pitch groups, aggregated server-side via the
+    # multi-code hfPT filter (one concurrent request per group)
+    logger.info("Getting pitch group data...")
+    with ThreadPoolExecutor(max_workers=len(PITCH_GROUPS)) as executor:
+        group_futures = {
+            group_name: executor.submit(
+                get_combined_split_data, player_id, season,
+                {'pitch_type': list(group_pitches)}, now_str=now_str)
+            for group_name, group_pitches in PITCH_GROUPS.items()
+        }
+        for group_name, future in group_futures.items():
+            group_data = future.result()
             if group_data and group_data.get('atBats', 0) >= 10:  # Higher threshold for groups
                 pitch_data[f"GROUP_{group_name}"] = group_data
-    
+
     return pitch_data
 
 def get_detailed_pitch_splits(player_id, season):
@@ -298,88 +578,86 @@ def get_detailed_pitch_splits(player_id, season):
     Returns:
     - dict: Detailed pitch split data
     """
-    pitch_types = [
-        # Fastball group
-        "FF", "SI", "FC",
-        # Offspeed group
-        "CH", "FS", "FO", "SC",
-        # Breaking group
-        "CU", "KC", "CS", "SL", "ST", "SV", "KN",
-        # Other group (skip less common ones)
-        "EP"
-    ]
-    
+    # All of the main groups, plus eephus (skip the other rare codes)
+    pitch_types = [p for group in ("Fastball", "Breaking", "Offspeed")
+                   for p in PITCH_GROUPS[group]] + ["EP"]
+
+
     pitcher_hands = ["L", "R"]
     locations = ["Home", "Road"]
-    
+
+    # One timestamp per run: every split row below shares it, which is
+    # both cheaper and semantically right for rows of the same fetch.
+    now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
     # Initialize the data structure
     detailed_splits = {
         "player_id": player_id,
         "season": season,
-        "lastUpdated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "lastUpdated": now_str,
         "splits": {}
     }
-    
-    # Get data for each pitch type by handedness and location
-    for pitch in pitch_types:
-        # Get data for this pitch type overall
-        pitch_data = get_combined_split_data(player_id, season, {'pitch_type': pitch})
-        if pitch_data and pitch_data.get('atBats', 0) >= 5:  # Only if we have enough data
-            split_key = f"pitch_{pitch}"
-            detailed_splits["splits"][split_key] = pitch_data
-            
-            # Get data by pitcher handedness
-            for hand in pitcher_hands:
-                hand_data = get_combined_split_data(player_id, season, {'pitch_type': pitch, 'pitcher_throws': hand})
-                if hand_data and hand_data.get('atBats', 0) >= 5:
-                    split_key = f"pitch_{pitch}_hand_{hand}"
-                    detailed_splits["splits"][split_key] = hand_data
-                    
-                    # Get data by location and handedness
-                    for location in locations:
-                        loc_data = get_combined_split_data(player_id, season, {
-                            'pitch_type': pitch, 
-                            'pitcher_throws': hand,
-                            'home_road': location
-                        })
-                        if loc_data and loc_data.get('atBats', 0) >= 5:
-                            split_key = f"pitch_{pitch}_hand_{hand}_loc_{location}"
-                            detailed_splits["splits"][split_key] = loc_data
-    
-    # Get data for pitch groups
-    pitch_groups = {
-        "Fastball": ["FF", "SI", "FC"],
-        "Breaking": ["CU", "KC", "CS", "SL", "ST", "SV", "KN"],
-        "Offspeed": ["CH", "FS", "FO", "SC"]
-    }
-    
-    # For each pitch group, also get by handedness and location
-    for group_name, group_pitches in pitch_groups.items():
+
+    # One cheap StatsAPI call short-circuits the whole fan-out for
+    # players who never batted in the season (pitchers, call-ups, IL).
+    if _season_plate_appearances(player_id, season) == 0:
+        logger.info("No plate appearances for player %s in %s; skipping detailed splits", player_id, season)
+        return detailed_splits
+    
+    # One grouped-by-pitch request covers every pitch type for a given
+    # hand/location filter, so the whole pitch dimension is fetched
+    # server-side: 7 requests (overall, per hand, per hand+location)
+    # replace the old call per pitch/hand/location combination. The
+    # remaining combos are fetched speculatively and concurrently, then
+    # filtered on at-bats.
+    combos = [("", {})]
+    combos += [(f"_hand_{hand}", {'pitcher_throws': hand})
+               for hand in pitcher_hands]
+    combos += [(f"_hand_{hand}_loc_{location}",
+                {'pitcher_throws': hand, 'home_road': location})
+               for hand, location in product(pitcher_hands, locations)]
+
+    def _fetch_combo(combo):
+        key_suffix, params = combo
+        return key_suffix, get_pitch_type_rows(player_id, season, pitch_types,
+                                               params, now_str=now_str)
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        for key_suffix, rows in executor.map(_fetch_combo, combos):
+            for pitch, data in rows.items():
+                if data.get('atBats', 0) >= 5:  # Only if we have enough data
+                    detailed_splits["splits"][f"pitch_{pitch}{key_suffix}"] = data
+    
+    # For each of the main pitch groups, also get by handedness and location
+    for group_name in ("Fastball", "Breaking", "Offspeed"):
+        group_pitches = PITCH_GROUPS[group_name]
         for hand in pitcher_hands:
-            hand_data = []
-            for pitch in group_pitches:
-                # Look for existing data for this pitch and hand
-                split_key = f"pitch_{pitch}_hand_{hand}"
-                if split_key in detailed_splits["splits"]:
-                    hand_data.append(detailed_splits["splits"][split_key])
-            
+            # Collect the already-fetched per-pitch splits for this
+            # hand; one .get per key instead of a membership test plus
+            # a second lookup
+            hand_data = [d for pitch in group_pitches
+                         if (d := detailed_splits["splits"].get(f"pitch_{pitch}_hand_{hand}")) is not None]
+
+
             # Summarize the group data
             if hand_data:
-                # Simple average of AVG, OPS, etc.
-                avg_sum = sum(float(d['avg']) for d in hand_data if d['avg'] != 'N/A')
-                ops_sum = sum(float(d['ops']) for d in hand_data if d['ops'] != 'N/A')
+                # Simple average of AVG, OPS, etc. fmean runs in C and
+                # only divides by the values actually present, so a
+                # missing OPS no longer drags the group mean down.
+                avgs = [d['avg'] for d in hand_data if d['avg'] is not None]
+                opss = [d['ops'] for d in hand_data if d['ops'] is not None]
                 ab_sum = sum(d['atBats'] for d in hand_data)
                 hr_sum = sum(d['homeRuns'] for d in hand_data)
-                
-                if len(hand_data) > 0 and ab_sum > 0:
+
+                if avgs and ab_sum > 0:
                     group_key = f"group_{group_name}_hand_{hand}"
                     detailed_splits["splits"][group_key] = {
                         'split_name': f"{group_name} pitches vs {hand}HP",
-                        'avg': str(round(avg_sum / len(hand_data), 3)),
-                        'ops': str(round(ops_sum / len(hand_data), 3)),
+                        'avg': round(fmean(avgs), 3),
+                        'ops': round(fmean(opss), 3) if opss else None,
                         'atBats': ab_sum,
                         'homeRuns': hr_sum,
-                        'lastUpdated': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                        'lastUpdated': now_str
                     }
     
     return detailed_splits
@@ -418,8 +696,8 @@ def generate_performance_summary(player_name, player_id, season, all_data):
         # Overall stats
         if "overall" in basic_splits:
             summary["basic_splits"]["overall"] = {
-                "avg": basic_splits["overall"].get("avg", "N/A"),
-                "ops": basic_splits["overall"].get("ops", "N/A"),
+                "avg": basic_splits["overall"].get("avg"),
+                "ops": basic_splits["overall"].get("ops"),
                 "hr": basic_splits["overall"].get("homeRuns", 0),
                 "ab": basic_splits["overall"].get("atBats", 0)
             }
@@ -428,8 +706,8 @@ def generate_performance_summary(player_name, player_id, season, all_data):
         for hand in ["vs LHP", "vs RHP"]:
             if hand in basic_splits:
                 summary["basic_splits"][hand] = {
-                    "avg": basic_splits[hand].get("avg", "N/A"),
-                    "ops": basic_splits[hand].get("ops", "N/A"),
+                    "avg": basic_splits[hand].get("avg"),
+                    "ops": basic_splits[hand].get("ops"),
                     "hr": basic_splits[hand].get("homeRuns", 0),
                     "ab": basic_splits[hand].get("atBats", 0)
                 }
@@ -438,8 +716,8 @@ def generate_performance_summary(player_name, player_id, season, all_data):
         for loc in ["Home", "Away"]:
             if loc in basic_splits:
                 summary["basic_splits"][loc] = {
-                    "avg": basic_splits[loc].get("avg", "N/A"),
-                    "ops": basic_splits[loc].get("ops", "N/A"),
+                    "avg": basic_splits[loc].get("avg"),
+                    "ops": basic_splits[loc].get("ops"),
                     "hr": basic_splits[loc].get("homeRuns", 0),
                     "ab": basic_splits[loc].get("atBats", 0)
                 }
@@ -453,8 +731,8 @@ def generate_performance_summary(player_name, player_id, season, all_data):
             if not pitch_code.startswith("GROUP_") and data.get("atBats", 0) >= 10:
                 summary["pitch_type_summary"][pitch_code] = {
                     "name": data.get("split_name", pitch_code),
-                    "avg": data.get("avg", "N/A"),
-                    "ops": data.get("ops", "N/A"),
+                    "avg": data.get("avg"),
+                    "ops": data.get("ops"),
                     "hr": data.get("homeRuns", 0),
                     "ab": data.get("atBats", 0)
                 }
@@ -465,8 +743,8 @@ def generate_performance_summary(player_name, player_id, season, all_data):
                 group_name = pitch_code.replace("GROUP_", "")
                 summary["pitch_type_summary"][group_name] = {
                     "name": data.get("split_name", group_name),
-                    "avg": data.get("avg", "N/A"),
-                    "ops": data.get("ops", "N/A"),
+                    "avg": data.get("avg"),
+                    "ops": data.get("ops"),
                     "hr": data.get("homeRuns", 0),
                     "ab": data.get("atBats", 0)
                 }
@@ -480,21 +758,26 @@ def generate_performance_summary(player_name, player_id, season, all_data):
         
         for key, data in detailed_splits.items():
             # Only include splits with enough data
-            if data.get("atBats", 0) >= 10 and data.get("avg", "N/A") != "N/A":
+            if data.get("atBats", 0) >= 10 and data.get("avg") is not None:
                 if not key.startswith("group_"):  # Skip group summaries
+                    avg = data["avg"]
                     notable_splits.append({
                         "name": data.get("split_name", key),
-                        "avg": data.get("avg", "N/A"),
-                        "ops": data.get("ops", "N/A"),
+                        "avg": avg,
+                        "ops": data.get("ops"),
                         "hr": data.get("homeRuns", 0),
-                        "ab": data.get("atBats", 0)
+                        "ab": data.get("atBats", 0),
+                        # Stored once here so the heap comparisons below
+                        # skip the per-comparison dict lookups
+                        "_sort_key": avg
                     })
-        
-        # Sort by batting average (descending)
-        notable_splits.sort(key=lambda x: float(x["avg"]) if x["avg"] != "N/A" else 0, reverse=True)
-        
-        # Take top 5 notable splits
-        summary["notable_splits"] = notable_splits[:5]
+
+        # Take the top 5 splits by batting average without sorting the
+        # whole list (O(N log 5) instead of O(N log N))
+        top_splits = heapq.nlargest(5, notable_splits, key=itemgetter("_sort_key"))
+        for split in top_splits:
+            del split["_sort_key"]
+        summary["notable_splits"] = top_splits
     
     return summary
 
@@ -518,91 +801,60 @@ def print_performance_summary(summary):
     
     if "overall" in summary["basic_splits"]:
         overall = summary["basic_splits"]["overall"]
-        print(f"OVERALL:      AVG: {overall['avg']}  OPS: {overall['ops']}  HR: {overall['hr']}  AB: {overall['ab']}")
+        print(f"OVERALL:      AVG: {_fmt3(overall['avg'])}  OPS: {_fmt3(overall['ops'])}  HR: {overall['hr']}  AB: {overall['ab']}")
     
     print("\nSPLIT TYPE      AVG      OPS       HR      AB")
     print("-" * 60)
     
     if "vs LHP" in summary["basic_splits"]:
         lhp = summary["basic_splits"]["vs LHP"]
-        print(f"vs LHP:       {lhp['avg']}    {lhp['ops']}    {lhp['hr']:2d}     {lhp['ab']}")
+        print(f"vs LHP:       {_fmt3(lhp['avg'])}    {_fmt3(lhp['ops'])}    {lhp['hr']:2d}     {lhp['ab']}")
     
     if "vs RHP" in summary["basic_splits"]:
         rhp = summary["basic_splits"]["vs RHP"]
-        print(f"vs RHP:       {rhp['avg']}    {rhp['ops']}    {rhp['hr']:2d}     {rhp['ab']}")
+        print(f"vs RHP:       {_fmt3(rhp['avg'])}    {_fmt3(rhp['ops'])}    {rhp['hr']:2d}     {rhp['ab']}")
     
     if "Home" in summary["basic_splits"]:
         home = summary["basic_splits"]["Home"]
-        print(f"Home:         {home['avg']}    {home['ops']}    {home['hr']:2d}     {home['ab']}")
+        print(f"Home:         {_fmt3(home['avg'])}    {_fmt3(home['ops'])}    {home['hr']:2d}     {home['ab']}")
     
     if "Away" in summary["basic_splits"]:
         away = summary["basic_splits"]["Away"]
-        print(f"Away:         {away['avg']}    {away['ops']}    {away['hr']:2d}     {away['ab']}")
+        print(f"Away:         {_fmt3(away['avg'])}    {_fmt3(away['ops'])}    {away['hr']:2d}     {away['ab']}")
     
-    # Print pitch type summary if available
+    # Print pitch type summary if available. Individual pitches with
+    # enough at-bats are collected here in the same pass, for the
+    # best/worst analysis at the bottom.
+    valid_pitches = {}
     if summary["pitch_type_summary"]:
         print("\nPITCH TYPE PERFORMANCE:")
         print("-" * 60)
         print("PITCH TYPE     AVG      OPS       HR      AB")
         print("-" * 60)
         
-        # Group by pitch categories
-        categories = {
-            "Fastball": [],
-            "Breaking": [],
-            "Offspeed": [],
-            "Other": []
-        }
-        
         # First print the group summaries
         for group in ["Fastball", "Breaking", "Offspeed"]:
             if group in summary["pitch_type_summary"]:
                 data = summary["pitch_type_summary"][group]
-                print(f"{group:<14} {data['avg']}    {data['ops']}    {data['hr']:2d}     {data['ab']}")
+                print(f"{group:<14} {_fmt3(data['avg'])}    {_fmt3(data['ops'])}    {data['hr']:2d}     {data['ab']}")
                 
         print("-" * 60)
         
         # Then print individual pitch types, sorted by group
-        pitch_groups = {
-            "Fastball": ["FF", "SI", "FC"],
-            "Breaking": ["CU", "KC", "CS", "SL", "ST", "SV", "KN"],
-            "Offspeed": ["CH", "FS", "FO", "SC"],
-            "Other": ["EP", "FA", "IN", "PO"]
-        }
-        
-        pitch_names = {
-            "FF": "4-seam FB",
-            "SI": "Sinker",
-            "FC": "Cutter",
-            "CH": "Changeup",
-            "FS": "Splitter",
-            "FO": "Forkball",
-            "SC": "Screwball",
-            "CU": "Curveball",
-            "KC": "Knuckle Curve",
-            "CS": "Slow Curve",
-            "SL": "Slider",
-            "ST": "Sweeper",
-            "SV": "Slurve",
-            "KN": "Knuckleball",
-            "EP": "Eephus",
-            "FA": "Other FB",
-            "IN": "Int. Ball",
-            "PO": "Pitchout"
-        }
-        
-        for group, pitches in pitch_groups.items():
+        for group, pitches in PITCH_GROUPS.items():
             printed_header = False
             
             for pitch in pitches:
-                if pitch in summary["pitch_type_summary"]:
+                data = summary["pitch_type_summary"].get(pitch)
+                if data is not None:
                     if not printed_header:
                         print(f"\n{group} Pitches:")
                         printed_header = True
                     
-                    data = summary["pitch_type_summary"][pitch]
-                    pitch_display = pitch_names.get(pitch, pitch)
-                    print(f"  {pitch_display:<12} {data['avg']}    {data['ops']}    {data['hr']:2d}     {data['ab']}")
+                    pitch_display = PITCH_DISPLAY_NAMES.get(pitch, pitch)
+                    print(f"  {pitch_display:<12} {_fmt3(data['avg'])}    {_fmt3(data['ops'])}    {data['hr']:2d}     {data['ab']}")
+                    if data["ab"] >= 20 and data["avg"] is not None:
+                        valid_pitches[pitch] = data["avg"]
     
     # Print notable splits if available
     if summary["notable_splits"]:
@@ -612,7 +864,7 @@ def print_performance_summary(summary):
         print("-" * 80)
         
         for i, split in enumerate(summary["notable_splits"]):
-            print(f"{i+1}. {split['name']:<35} {split['avg']}    {split['ops']}    {split['hr']:2d}     {split['ab']}")
+            print(f"{i+1}. {split['name']:<35} {_fmt3(split['avg'])}    {_fmt3(split['ops'])}    {split['hr']:2d}     {split['ab']}")
     
     print("\n" + "="*80)
     print("SUMMARY OF STRENGTHS AND WEAKNESSES:")
@@ -620,10 +872,10 @@ def print_performance_summary(summary):
     # Analyze strengths and weaknesses
     # Pitcher handedness
     if "vs LHP" in summary["basic_splits"] and "vs RHP" in summary["basic_splits"]:
-        lhp_avg = float(summary["basic_splits"]["vs LHP"]["avg"])
-        rhp_avg = float(summary["basic_splits"]["vs RHP"]["avg"])
-        
-        if abs(lhp_avg - rhp_avg) >= 0.050:  # Significant difference
+        lhp_avg = summary["basic_splits"]["vs LHP"]["avg"]
+        rhp_avg = summary["basic_splits"]["vs RHP"]["avg"]
+
+        if lhp_avg is not None and rhp_avg is not None and abs(lhp_avg - rhp_avg) >= 0.050:  # Significant difference
             if lhp_avg > rhp_avg:
                 print(f"- Strong vs LHP: {lhp_avg:.3f} AVG vs LHP compared to {rhp_avg:.3f} vs RHP")
             else:
@@ -631,48 +883,29 @@ def print_performance_summary(summary):
     
     # Home/Away
     if "Home" in summary["basic_splits"] and "Away" in summary["basic_splits"]:
-        home_avg = float(summary["basic_splits"]["Home"]["avg"])
-        away_avg = float(summary["basic_splits"]["Away"]["avg"])
-        
-        if abs(home_avg - away_avg) >= 0.050:  # Significant difference
+        home_avg = summary["basic_splits"]["Home"]["avg"]
+        away_avg = summary["basic_splits"]["Away"]["avg"]
+
+        if home_avg is not None and away_avg is not None and abs(home_avg - away_avg) >= 0.050:  # Significant difference
             if home_avg > away_avg:
                 print(f"- Home field advantage: {home_avg:.3f} AVG at home compared to {away_avg:.3f} away")
             else:
                 print(f"- Performs better on the road: {away_avg:.3f} AVG away compared to {home_avg:.3f} at home")
     
-    # Pitch type strengths
-    if summary["pitch_type_summary"]:
-        # Get individual pitch types with enough at-bats
-        valid_pitches = {}
-        for pitch, data in summary["pitch_type_summary"].items():
-            if pitch not in ["Fastball", "Breaking", "Offspeed"] and data["ab"] >= 20:
-                valid_pitches[pitch] = float(data["avg"])
+    # Pitch type strengths, from the pitches collected above
+    if valid_pitches:
+        best_pitch = max(valid_pitches.items(), key=lambda x: x[1])
+        worst_pitch = min(valid_pitches.items(), key=lambda x: x[1])
         
-        # Find best and worst pitch types
-        if valid_pitches:
-            best_pitch = max(valid_pitches.items(), key=lambda x: x[1])
-            worst_pitch = min(valid_pitches.items(), key=lambda x: x[1])
-            
-            pitch_names = {
-                "FF": "4-seam Fastball",
-                "SI": "Sinker",
-                "FC": "Cutter",
-                "CH": "Changeup",
-                "FS": "Splitter",
-                "CU": "Curveball",
-                "SL": "Slider",
-                "ST": "Sweeper"
-            }
-            
-            best_name = pitch_names.get(best_pitch[0], best_pitch[0])
-            worst_name = pitch_names.get(worst_pitch[0], worst_pitch[0])
-            
-            print(f"- Best against {best_name}: {best_pitch[1]:.3f} AVG")
-            print(f"- Worst against {worst_name}: {worst_pitch[1]:.3f} AVG")
+        best_name = PITCH_TYPES.get(best_pitch[0], best_pitch[0])
+        worst_name = PITCH_TYPES.get(worst_pitch[0], worst_pitch[0])
+        
+        print(f"- Best against {best_name}: {best_pitch[1]:.3f} AVG")
+        print(f"- Worst against {worst_name}: {worst_pitch[1]:.3f} AVG")
     
     print("="*80)
 
-def save_player_detailed_data(player_name, player_id, season, all_data):
+def save_player_detailed_data(player_name, player_id, season, all_data, store=None):
     """
     Save all player data to files
     
@@ -681,57 +914,279 @@ def save_player_detailed_data(player_name, player_id, season, all_data):
     - player_id (int): Player's ID
     - season (int): Season year
     - all_data (dict): All collected data
+    - store (CareerStore): Batch store for the career-file updates
     """
-    # Create directory structure if needed
+    # Create directory structure if needed (idempotent, no exists check)
     data_dirs = ["splits", "pitch_data", "detailed_splits", "summaries"]
     for dir_name in data_dirs:
-        if not os.path.exists(dir_name):
-            os.makedirs(dir_name)
-    
-    # Save basic splits
+        os.makedirs(dir_name, exist_ok=True)
+
+    # Save basic splits. orjson serializes straight to bytes in C, so
+    # these writes skip the slow pure-Python indented encoder entirely.
     if "basic_splits" in all_data:
         filename = f"splits/{player_name.replace(' ', '_')}_{season}_splits.json"
         try:
-            with open(filename, 'w') as f:
-                json.dump(all_data["basic_splits"], f, indent=2)
-            print(f"Saved basic splits to {filename}")
+            Path(filename).write_bytes(orjson.dumps(
+                all_data["basic_splits"],
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            logger.info("Saved basic splits to %s", filename)
         except Exception as e:
-            print(f"Error saving basic splits: {e}")
-    
+            logger.warning("Error saving basic splits: %s", e)
+
     # Save pitch data
     if "pitch_data" in all_data:
         filename = f"pitch_data/{player_name.replace(' ', '_')}_{season}_pitch_types.json"
         try:
-            with open(filename, 'w') as f:
-                json.dump(all_data["pitch_data"], f, indent=2)
-            print(f"Saved pitch data to {filename}")
+            Path(filename).write_bytes(orjson.dumps(
+                all_data["pitch_data"],
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            logger.info("Saved pitch data to %s", filename)
         except Exception as e:
-            print(f"Error saving pitch data: {e}")
-    
+            logger.warning("Error saving pitch data: %s", e)
+
     # Save detailed splits
     if "detailed_splits" in all_data:
         filename = f"detailed_splits/{player_name.replace(' ', '_')}_{season}_detailed.json"
         try:
-            with open(filename, 'w') as f:
-                json.dump(all_data["detailed_splits"], f, indent=2)
-            print(f"Saved detailed splits to {filename}")
+            Path(filename).write_bytes(orjson.dumps(
+                all_data["detailed_splits"],
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            logger.info("Saved detailed splits to %s", filename)
         except Exception as e:
-            print(f"Error saving detailed splits: {e}")
-    
+            logger.warning("Error saving detailed splits: %s", e)
+
     # Save summary
     if "summary" in all_data:
         filename = f"summaries/{player_name.replace(' ', '_')}_{season}_summary.json"
         try:
-            with open(filename, 'w') as f:
-                json.dump(all_data["summary"], f, indent=2)
-            print(f"Saved summary to {filename}")
+            Path(filename).write_bytes(orjson.dumps(
+                all_data["summary"],
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            logger.info("Saved summary to %s", filename)
         except Exception as e:
-            print(f"Error saving summary: {e}")
+            logger.warning("Error saving summary: %s", e)
     
     # Update career files
-    update_career_files(player_name, player_id, season, all_data)
+    update_career_files(player_name, player_id, season, all_data, store=store)
+
+# WAL sidecar for career files: the common "only this season changed"
+# update appends one patch line to <path>.patch.jsonl instead of
+# rewriting the snapshot; loads replay the patches, and the WAL is
+# folded back into a fresh snapshot once it grows past the threshold.
+_PATCH_SUFFIX = '.patch.jsonl'
+_PATCH_COMPACT_BYTES = 1 << 20
+
+class CareerStore:
+    """
+    Write-back cache for the career JSON files.
+
+    Each file is parsed at most once per batch and rewritten at most
+    once on exit, so updating N players costs one load and one save per
+    file instead of N full parse+serialize cycles against
+    all_players_career.json. Use as a context manager around a batch:
+
+        with CareerStore() as store:
+            for name in players:
+                get_complete_player_data(name, season)  # or pass store=
+    """
+
+    def __init__(self):
+        self._cache = {}
+        self._dirty = set()
+        self._pending_players = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.flush()
+        return False
+
+    def load(self, path):
+        """
+        Get the parsed dict for path, reading the file on first use.
+
+        Parameters:
+        - path (str): JSON file path
+
+        Returns:
+        - dict: Cached contents ({} if the file is missing or unreadable)
+        """
+        if path not in self._cache:
+            data = {}
+            # EAFP: open directly and let a missing file raise instead
+            # of paying a stat() before every open (and racing it)
+            try:
+                # Binary read: orjson parses bytes directly
+                with open(path, 'rb') as f:
+                    raw = f.read()
+            except FileNotFoundError:
+                pass
+            else:
+                try:
+                    data = orjson.loads(raw)
+                    logger.info("Loaded existing career data from %s", path)
+                except Exception as e:
+                    logger.warning("Error loading career data from %s: %s", path, e)
+            try:
+                with open(path + _PATCH_SUFFIX, 'rb') as f:
+                    for line in f:
+                        if line.strip():
+                            patch = orjson.loads(line)
+                            self._apply_patch(data, patch["path"],
+                                              patch["value"], patch["ts"])
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning("Error replaying patches for %s: %s", path, e)
+            self._cache[path] = data
+        return self._cache[path]
+
+    def mark_dirty(self, path):
+        """
+        Mark a cached file as modified so flush() rewrites it.
+
+        Parameters:
+        - path (str): JSON file path previously obtained via load()
+        """
+        self._dirty.add(path)
+
+    def append_patch(self, path, keys, value, ts):
+        """
+        Record a single nested-key set without rewriting the snapshot.
+
+        The patch is appended durably to path + '.patch.jsonl' right
+        away (O(one record) instead of O(file)) and applied to the
+        cached dict so in-process readers see it. Once the WAL passes
+        _PATCH_COMPACT_BYTES the file is marked dirty, so the next
+        flush folds the replayed state into a fresh snapshot and
+        drops the WAL.
+
+        Parameters:
+        - path (str): JSON file path previously obtained via load()
+        - keys (list): Nested key path to set, e.g. ["seasons", "2024"]
+        - value: Value to store at that key path
+        - ts (str): Timestamp recorded as the file's lastUpdated
+        """
+        line = orjson.dumps(
+            {"op": "set", "path": keys, "value": value, "ts": ts}) + b'\n'
+        with open(path + _PATCH_SUFFIX, 'ab') as f:
+            f.write(line)
+            wal_size = f.tell()
+        self._apply_patch(self.load(path), keys, value, ts)
+        if wal_size > _PATCH_COMPACT_BYTES:
+            self._dirty.add(path)
+
+    @staticmethod
+    def _apply_patch(data, keys, value, ts):
+        """Set a nested key path on data, stamping lastUpdated."""
+        target = data
+        for key in keys[:-1]:
+            target = target.setdefault(key, {})
+        target[keys[-1]] = value
+        data["lastUpdated"] = ts
+
+    def update_player_entry(self, path, player_name, update_entry):
+        """
+        Queue a single top-level entry update for a JSON object file.
 
-def update_career_files(player_name, player_id, season, all_data):
+        Updates to the same player chain, so several seasons written in
+        one batch all survive the single flush-time splice.
+
+        Parameters:
+        - path (str): JSON object file path
+        - player_name (str): Top-level key to update
+        - update_entry (callable): Called with the current entry (or
+          None if absent); returns the entry to write
+        """
+        pending = self._pending_players.setdefault(path, {})
+        previous = pending.get(player_name)
+        if previous is not None:
+            pending[player_name] = lambda entry: update_entry(previous(entry))
+        else:
+            pending[player_name] = update_entry
+
+    def flush(self):
+        """Write every dirty or spliced file back to disk once."""
+        for path in self._dirty:
+            tmp_path = path + '.tmp'
+            try:
+                # Write-then-rename so a crash mid-dump never leaves a
+                # truncated career file behind; the 1 MiB buffer turns
+                # a multi-MB dump into a handful of write() syscalls
+                with open(tmp_path, 'wb', buffering=1 << 20) as out:
+                    out.write(orjson.dumps(
+                        self._cache[path],
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+                os.replace(tmp_path, path)
+                # The snapshot now holds the replayed state, so the
+                # WAL is stale; EAFP remove
+                try:
+                    os.remove(path + _PATCH_SUFFIX)
+                except FileNotFoundError:
+                    pass
+                logger.info("Updated career data in %s", path)
+            except Exception as e:
+                logger.warning("Error saving career data to %s: %s", path, e)
+        self._dirty.clear()
+        for path, updates in self._pending_players.items():
+            try:
+                _splice_player_entries(path, updates)
+                logger.info("Updated all-players data in %s", path)
+            except Exception as e:
+                logger.warning("Error saving all-players data to %s: %s", path, e)
+        self._pending_players.clear()
+
+def _splice_player_entries(path, updates):
+    """
+    Splice player records into a top-level JSON object file without
+    materializing the whole file.
+
+    Every untouched player's entry is streamed straight from the old
+    file to a temp file via ijson, updated entries are substituted when
+    their keys appear (or appended if new), and the temp file
+    atomically replaces the original via os.replace. Peak memory is one
+    player's record instead of the whole collection, and a crash
+    mid-write never leaves a truncated file behind.
+
+    Parameters:
+    - path (str): Path to the JSON object file
+    - updates (dict): Top-level key -> callable; each is called with
+      the key's current entry (or None if absent) and returns the
+      entry to write
+    """
+    tmp_path = path + '.tmp'
+    remaining = dict(updates)
+    # 1 MiB buffer: the splice emits many small key/value writes, so
+    # batching them keeps syscalls at O(file_size / 1 MiB)
+    with open(tmp_path, 'wb', buffering=1 << 20) as out:
+        out.write(b'{')
+        first = True
+        # EAFP: a missing file just means there is nothing to stream
+        try:
+            f = open(path, 'rb')
+        except FileNotFoundError:
+            pass
+        else:
+            with f:
+                for key, value in ijson.kvitems(f, '', use_float=True):
+                    if not first:
+                        out.write(b',\n')
+                    first = False
+                    update_entry = remaining.pop(key, None)
+                    if update_entry is not None:
+                        value = update_entry(value)
+                    out.write(orjson.dumps(key) + b': ' + orjson.dumps(value))
+        for key, update_entry in remaining.items():
+            if not first:
+                out.write(b',\n')
+            first = False
+            out.write(orjson.dumps(key) + b': '
+                      + orjson.dumps(update_entry(None)))
+        out.write(b'}')
+    os.replace(tmp_path, path)
+
+def update_career_files(player_name, player_id, season, all_data, store=None):
     """
     Update career files with new season data
     
@@ -740,84 +1195,142 @@ def update_career_files(player_name, player_id, season, all_data):
     - player_id (int): Player's ID
     - season (int): Season year
     - all_data (dict): All collected data
+    - store (CareerStore): Batch store to accumulate writes in; when
+      None the process-wide store is used and the files are written
+      once at exit
     """
+    if store is None:
+        store = _PENDING_STORE
+
+    # One timestamp per update, shared by both files
+    ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
     # Update career basic splits
     if "basic_splits" in all_data:
         career_filename = f"splits/{player_name.replace(' ', '_')}_career.json"
-        career_data = {}
-        
-        if os.path.exists(career_filename):
-            try:
-                with open(career_filename, 'r') as f:
-                    career_data = json.load(f)
-                print(f"Loaded existing career data from {career_filename}")
-            except Exception as e:
-                print(f"Error loading career data: {e}")
-        
-        # Initialize career data if needed
-        if "player" not in career_data:
+        career_data = store.load(career_filename)
+
+        if "player" in career_data:
+            # Fast path (the common case): the file exists and only
+            # this season's entry changes, so append one WAL patch
+            # line instead of rewriting the whole snapshot
+            store.append_patch(career_filename, ["seasons", str(season)],
+                               all_data["basic_splits"], ts)
+        else:
+            # First write: build the snapshot and let flush() dump it
             career_data["player"] = {
                 "name": player_name,
                 "id": player_id
             }
-        
-        if "seasons" not in career_data:
-            career_data["seasons"] = {}
-        
-        # Update this season's data
-        career_data["seasons"][str(season)] = all_data["basic_splits"]
-        career_data["lastUpdated"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-        # Save updated career data
-        try:
-            with open(career_filename, 'w') as f:
-                json.dump(career_data, f, indent=2)
-            print(f"Updated career data in {career_filename}")
-        except Exception as e:
-            print(f"Error saving career data: {e}")
+            career_data["seasons"] = {str(season): all_data["basic_splits"]}
+            career_data["lastUpdated"] = ts
+            store.mark_dirty(career_filename)
     
     # Update all players file
     all_players_filename = "all_players_career.json"
-    all_players_data = {}
-    
-    if os.path.exists(all_players_filename):
-        try:
-            with open(all_players_filename, 'r') as f:
-                all_players_data = json.load(f)
-            print(f"Loaded existing all-players data from {all_players_filename}")
-        except Exception as e:
-            print(f"Error loading all-players data: {e}")
-    
-    # Initialize player if needed
-    if player_name not in all_players_data:
-        all_players_data[player_name] = {
-            "player": {
-                "name": player_name,
-                "id": player_id
-            },
-            "seasons": {}
-        }
-    
-    # Update player data with this season
-    if "summary" in all_data:
-        all_players_data[player_name]["seasons"][str(season)] = all_data["summary"]
-        all_players_data[player_name]["lastUpdated"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    # Save updated all-players file
+
+    def _update_entry(entry):
+        # Initialize player if needed
+        if entry is None:
+            entry = {
+                "player": {
+                    "name": player_name,
+                    "id": player_id
+                },
+                "seasons": {}
+            }
+        # Update player data with this season
+        if "summary" in all_data:
+            entry["seasons"][str(season)] = all_data["summary"]
+            entry["lastUpdated"] = ts
+        return entry
+
+    # Queued for a single flush-time streaming splice, so the rest of
+    # the (growing) file is never parsed no matter how many players
+    # are updated this process
+    store.update_player_entry(all_players_filename, player_name, _update_entry)
+
+# Append-only JSONL career log: one record per line, so recording a
+# player-season costs one small append no matter how large the log
+# grows, instead of rewriting a monolithic JSON file.
+CAREER_LOG = "all_players_career.jsonl"
+
+def career_append(record):
+    """
+    Append one record to the JSONL career log.
+
+    O(one record) regardless of log size; the 1 MiB write buffer keeps
+    syscalls rare. Superseded records for the same player/season stay
+    in the log until career_compact() drops them.
+
+    Parameters:
+    - record (dict): Career record; should carry 'player' and 'season'
+    """
+    with open(CAREER_LOG, 'ab', buffering=1 << 20) as f:
+        f.write(orjson.dumps(record) + b'\n')
+
+def career_iter():
+    """
+    Iterate the records in the JSONL career log, oldest first.
+
+    The log is memory-mapped and split on newlines lazily, so reads
+    stream through the page cache without copying the file into the
+    heap.
+
+    Returns:
+    - generator: Parsed record dicts
+    """
     try:
-        with open(all_players_filename, 'w') as f:
-            json.dump(all_players_data, f, indent=2)
-        print(f"Updated all-players data in {all_players_filename}")
-    except Exception as e:
-        print(f"Error saving all-players data: {e}")
+        f = open(CAREER_LOG, 'rb')
+    except FileNotFoundError:
+        return
+    with f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0
+            size = len(mm)
+            while start < size:
+                end = mm.find(b'\n', start)
+                if end == -1:
+                    end = size
+                line = mm[start:end]
+                start = end + 1
+                if line:
+                    yield orjson.loads(line)
 
-def get_complete_player_data(player_name, season=2024):
+def career_compact():
+    """
+    Rewrite the career log keeping only the newest record per
+    (player, season), then atomically replace the old log. Run this
+    periodically to stop superseded appends from accumulating.
+    """
+    latest = {}
+    for record in career_iter():
+        latest[(record.get('player'), record.get('season'))] = record
+    if not latest:
+        return
+    tmp_path = CAREER_LOG + '.tmp'
+    with open(tmp_path, 'wb', buffering=1 << 20) as f:
+        for record in latest.values():
+            f.write(orjson.dumps(record) + b'\n')
+    os.replace(tmp_path, CAREER_LOG)
+    logger.info("Compacted career log %s to %d records", CAREER_LOG, len(latest))
+
+# Process-wide write-back store: repeated single-shot updates coalesce
+# into one write per file, flushed once when the process exits.
+_PENDING_STORE = CareerStore()
+atexit.register(_PENDING_STORE.flush)
+
+def get_complete_player_data(player_name, season=2024, store=None):
     """
     Get complete player data including basic splits, pitch types, and detailed splits
     
     Parameters:
     - player_name (str): Player's name
     - season (int): Season year
+    - store (CareerStore): Batch store for the career-file updates;
+      pass one when looping over many players to coalesce the writes
     
     Returns:
     - dict: All player data
@@ -829,42 +1342,34 @@ def get_complete_player_data(player_name, season=2024):
     # Get all data
     all_data = {}
     
-    # 1. Get basic splits (LHP/RHP, Home/Away)
-    print("\nGetting basic splits...")
-    basic_splits = {}
-    
-    # Get overall stats
-    overall_stats = get_baseball_savant_data(player_id, season, 'overall', 'total')
-    if overall_stats:
-        basic_splits["overall"] = overall_stats
-    
-    # Get pitcher handedness splits
-    for hand in ['R', 'L']:
-        stats = get_baseball_savant_data(player_id, season, 'pitcher_throws', hand)
-        if stats:
-            basic_splits[f'vs {hand}HP'] = stats
-    
-    # Get home/away splits
-    for location in [('Home', 'Home'), ('Road', 'Away')]:
-        savant_param, split_name = location
-        stats = get_baseball_savant_data(player_id, season, 'home_road', savant_param)
-        if stats:
-            basic_splits[split_name] = stats
-    
-    all_data["basic_splits"] = basic_splits
-    
-    # 2. Get pitch type data
-    print("\nGetting pitch type data...")
-    pitch_data = get_pitch_type_data(player_id, season)
-    all_data["pitch_data"] = pitch_data
-    
-    # 3. Get detailed pitch splits
-    print("\nGetting detailed pitch splits...")
-    detailed_splits = get_detailed_pitch_splits(player_id, season)
-    all_data["detailed_splits"] = detailed_splits
-    
+    # 1-3. The basic splits, pitch-type data and detailed splits have
+    # no dependencies on each other, so all three run as one concurrent
+    # wave against the shared pooled session. Every basic-split row is
+    # stamped with the same lastUpdated timestamp.
+    logger.info("Getting basic splits, pitch types and detailed splits...")
+    now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        basic_futures = [
+            (split_key, executor.submit(get_baseball_savant_data, player_id, season,
+                                        parameter_name, parameter_value, now_str=now_str))
+            for split_key, parameter_name, parameter_value in FETCH_SPECS
+        ]
+        pitch_future = executor.submit(get_pitch_type_data, player_id, season)
+        detailed_future = executor.submit(get_detailed_pitch_splits, player_id, season)
+
+        basic_splits = {}
+        for split_key, future in basic_futures:
+            stats = future.result()
+            if stats:
+                basic_splits[split_key] = stats
+
+        all_data["basic_splits"] = basic_splits
+        all_data["pitch_data"] = pitch_future.result()
+        all_data["detailed_splits"] = detailed_future.result()
+
     # 4. Generate summary
-    print("\nGenerating performance summary...")
+    logger.info("Generating performance summary...")
     summary = generate_performance_summary(player_name, player_id, season, all_data)
     all_data["summary"] = summary
     
@@ -872,6 +1377,6 @@ def get_complete_player_data(player_name, season=2024):
     print_performance_summary(summary)
     
     # Save all data
-    save_player_detailed_data(player_name, player_id, season, all_data)
+    save_player_detailed_data(player_name, player_id, season, all_data, store=store)
     
     return all_data
\ No newline at end of file
@@ -0,0 +1,106 @@
+from datetime import datetime
+from functools import lru_cache
+
+import requests
+
+MLB_API = "https://statsapi.mlb.com/api/v1"
+
+@lru_cache(maxsize=4096)
+def get_player_id(player_name):
+    """
+    Get the player ID from the MLB StatsAPI search endpoint.
+
+    Memoized: batch runs over many seasons repeat the same names, and
+    each repeat would otherwise be a full HTTP round trip. Use
+    get_player_id.cache_clear() to drop the memo.
+
+    Parameters:
+    - player_name (str): Full name of the player to search for
+
+    Returns:
+    - int: Player ID if found, None otherwise
+    """
+    response = requests.get(
+        f"{MLB_API}/people/search", params={'names': player_name}, timeout=30)
+    if response.status_code != 200:
+        print(f"Error searching for {player_name}: status {response.status_code}")
+        return None
+
+    people = response.json().get('people', [])
+    if not people:
+        print(f"Player '{player_name}' not found")
+        return None
+
+    return people[0]['id']
+
+def get_player_splits(player_name, season=2024, split_type=None):
+    """
+    Get a player's situational splits, folded into
+    {split_description: {group_name: {stat: value}}}.
+
+    The response is flattened into (split, group, stat, value) rows in
+    one comprehension and folded in a single pass, instead of building
+    the nested dicts through four levels of loops with per-stat .get()
+    chains.
+
+    Parameters:
+    - player_name (str): Full name of the player
+    - season (int): Season year
+    - split_type (str): Only keep splits whose description matches
+      (e.g. 'vs Left'); None keeps everything
+
+    Returns:
+    - dict: Nested splits data, or None if the player is unknown
+    """
+    player_id = get_player_id(player_name)
+    if not player_id:
+        return None
+
+    response = requests.get(
+        f"{MLB_API}/people/{player_id}/stats",
+        params={
+            'stats': 'statSplits',
+            'group': 'hitting,pitching,fielding',
+            'season': season,
+        },
+        timeout=30)
+    if response.status_code != 200:
+        print(f"Error fetching splits: status {response.status_code}")
+        return None
+
+    person = response.json()
+
+    # Flatten to rows, filtering before the fold so skipped splits
+    # never allocate anything
+    rows = [(s['split']['description'],
+             sg.get('group', {}).get('displayName', 'unknown'),
+             k, v)
+            for sg in person.get('stats', [])
+            for s in sg.get('splits', [])
+            if s.get('split', {}).get('description')
+            and (split_type is None
+                 or s['split']['description'] == split_type)
+            for k, v in s.get('stat', {}).items()]
+
+    splits_data = {
+        'player': player_name,
+        'player_id': player_id,
+        'season': season,
+        'lastUpdated': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        'splits': {},
+    }
+    for split_name, group_type, key, value in rows:
+        splits_data['splits'].setdefault(split_name, {}).setdefault(group_type, {})[key] = value
+
+    return splits_data
+
+if __name__ == "__main__":
+    name = input("Enter player name: ").strip()
+    year = input("Enter season year (default 2024): ").strip()
+
+    splits = get_player_splits(name, int(year) if year else 2024)
+    if splits:
+        for split_name, groups in splits['splits'].items():
+            print(f"\n{split_name}:")
+            for group_name, stats in groups.items():
+                print(f"  {group_name}: {stats}")
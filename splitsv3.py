@@ -0,0 +1,346 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from functools import lru_cache
+import hashlib
+import io
+import json
+import logging
+import os
+
+import pandas as pd
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson serializes/parses several times faster than stdlib json and
+# works on bytes; fall back transparently when it is not installed.
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def _canonical(obj):
+        # Key-sorted form for hashing: insensitive to dict build order
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, indent=2).encode()
+
+    def _canonical(obj):
+        return json.dumps(obj, sort_keys=True).encode()
+
+    _loads = json.loads
+
+# Lazy %s formatting plus a WARNING default means the per-fetch
+# diagnostics below cost a level check instead of a serialized stdout
+# write, which matters once the fetches fan out across threads.
+logger = logging.getLogger(__name__)
+
+MLB_API = "https://statsapi.mlb.com/api/v1"
+
+# Constant tail of the statcast_search CSV query; only season, player
+# id and grouping vary per call.
+SAVANT_CSV = (
+    "https://baseballsavant.mlb.com/statcast_search/csv?hfPT="
+    "&hfAB=&hfGT=R%7C&hfPR=&hfZ=&stadium=&hfBBL=&hfNewZones=&hfPull=&hfC="
+    "&hfSea={season}%7C&hfSit=&player_type=batter&hfOuts=&opponent="
+    "&batter_stands=&hfSA=&game_date_gt=&game_date_lt=&hfInfield=&team="
+    "&position=&hfOutfield=&hfRO=&hfFlag=&hfBBT=&metric_1=&hfInn="
+    "&min_pitches=0&min_results=0&group_by={group_by}&sort_col=xwoba"
+    "&player_event_sort=api_p_release_speed&sort_order=desc&min_pas=0"
+    "&player_id={player_id}"
+)
+
+# One pooled session shared by all workers: the five fetches per player
+# reuse keep-alive connections instead of handshaking per request.
+# Responses are cached on disk (SQLite) so repeat runs for the same
+# player skip the network entirely; the default 6h expiry covers
+# anything not routed through _cached_get below.
+# Retries absorb the occasional flaky 5xx/connection reset from the
+# public endpoints instead of surfacing it as a missing split.
+SESSION = requests_cache.CachedSession(
+    'mlb_cache', backend='sqlite', expire_after=21600)
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4, pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.3)))
+
+def _cached_get(url, season):
+    """
+    Fetch a URL with season-aware cache expiry: past seasons are
+    immutable so their responses never expire, while current-season
+    responses go stale after an hour.
+
+    Parameters:
+    - url (str): URL to fetch
+    - season (int): Season year the query is scoped to
+
+    Returns:
+    - requests.Response: The (possibly cached) response
+    """
+    if int(season) < datetime.now().year:
+        return SESSION.get(url, timeout=30,
+                           expire_after=requests_cache.NEVER_EXPIRE)
+    return SESSION.get(url, timeout=30, expire_after=3600)
+
+@lru_cache(maxsize=4096)
+def get_player_id(player_name):
+    """
+    Get the player ID from the MLB StatsAPI search endpoint.
+
+    Memoized: batch runs over many seasons repeat the same names, and
+    each repeat would otherwise be a full HTTP round trip. Use
+    get_player_id.cache_clear() to drop the memo.
+
+    Parameters:
+    - player_name (str): Full name of the player to search for
+
+    Returns:
+    - int: Player ID if found, None otherwise
+    """
+    response = SESSION.get(
+        f"{MLB_API}/people/search", params={'names': player_name}, timeout=30)
+    if response.status_code != 200:
+        logger.warning("Error searching for %s: status %s", player_name,
+                       response.status_code)
+        return None
+
+    people = response.json().get('people', [])
+    if not people:
+        logger.warning("Player '%s' not found", player_name)
+        return None
+
+    player_id = people[0]['id']
+    logger.debug("Found player: %s (ID: %s)", player_name, player_id)
+    return player_id
+
+def _savant_url(season, player_id, group_by):
+    """
+    Build a Savant statcast_search CSV URL.
+
+    Parameters:
+    - season (int): Season year
+    - player_id (int): MLB player ID
+    - group_by (str): Savant grouping ('name-stats' or 'pitch_name')
+
+    Returns:
+    - str: Fully-formed CSV download URL
+    """
+    return SAVANT_CSV.format(
+        season=season, player_id=player_id, group_by=group_by)
+
+def _parse_statsapi_splits(response):
+    """
+    Extract the splits list from a StatsAPI statSplits response.
+
+    Parameters:
+    - response (requests.Response): StatsAPI stats response
+
+    Returns:
+    - list: Split dicts (possibly empty)
+    """
+    stats = response.json().get('stats', [])
+    if not stats:
+        return []
+    return stats[0].get('splits', [])
+
+def _parse_statsapi_hand_splits(response):
+    """
+    Route the splits from a coalesced vl,vr statSplits response to
+    their vs_lhp / vs_rhp keys.
+
+    Parameters:
+    - response (requests.Response): statSplits response for sitCodes vl,vr
+
+    Returns:
+    - dict: {'vs_rhp': [...], 'vs_lhp': [...]}
+    """
+    routed = {'vs_rhp': [], 'vs_lhp': []}
+    for split in _parse_statsapi_splits(response):
+        code = split.get('split', {}).get('code')
+        if code == 'vr':
+            routed['vs_rhp'].append(split)
+        elif code == 'vl':
+            routed['vs_lhp'].append(split)
+    return routed
+
+def _parse_savant_season_csv(response):
+    """
+    Parse the single aggregated season row from a Savant CSV response.
+
+    Parameters:
+    - response (requests.Response): Savant statcast_search CSV response
+
+    Returns:
+    - dict: Season stats, or empty dict if no row came back
+    """
+    # BytesIO wrapper: read_csv wants a file-like object, not raw
+    # bytes. usecols lets the C tokenizer skip the ~20 columns of the
+    # wide Savant schema we never read.
+    df = pd.read_csv(
+        io.BytesIO(response.content), engine='c',
+        usecols=['ba', 'slg', 'obp', 'hrs', 'so', 'bb', 'abs', 'pa'],
+        dtype={'ba': 'float32', 'slg': 'float32', 'obp': 'float32'})
+    if df.empty:
+        return {}
+
+    # One row extraction instead of eight per-column lookups; nothing
+    # here materializes a whole column
+    row = df.iloc[0]
+    return {
+        'avg': float(row['ba']),
+        'slg': float(row['slg']),
+        'obp': float(row['obp']),
+        'homeRuns': int(row['hrs']),
+        'strikeOuts': int(row['so']),
+        'baseOnBalls': int(row['bb']),
+        'atBats': int(row['abs']),
+        'plateAppearances': int(row['pa']),
+    }
+
+def _parse_savant_pitch_csv(response):
+    """
+    Parse the per-pitch-type rows from a grouped Savant CSV response.
+
+    Parameters:
+    - response (requests.Response): Savant CSV grouped by pitch_name
+
+    Returns:
+    - dict: Pitch name -> stats dict for every pitch with at-bats
+    """
+    df = pd.read_csv(
+        io.BytesIO(response.content), engine='c',
+        usecols=['pitch_name', 'ba', 'slg', 'hrs', 'abs'],
+        dtype={'ba': 'float32', 'slg': 'float32'})
+    pitches = {}
+    for _, row in df.iterrows():
+        if int(row['abs']) <= 0:
+            continue
+        pitches[row['pitch_name']] = {
+            'avg': float(row['ba']),
+            'slg': float(row['slg']),
+            'homeRuns': int(row['hrs']),
+            'atBats': int(row['abs']),
+        }
+    return pitches
+
+def get_player_complete_splits(player_name, season=2024):
+    """
+    Get a player's situational splits and Savant season/pitch data,
+    fetched concurrently.
+
+    The four requests (home/away, both handedness splits coalesced
+    into one call, two Savant CSVs) are independent and network-bound,
+    so they all go out in one ThreadPoolExecutor wave; end-to-end
+    latency is the slowest single round trip instead of the sum of
+    four.
+
+    Parameters:
+    - player_name (str): Full name of the player
+    - season (int): Season year
+
+    Returns:
+    - dict: All splits keyed by source, or None if the player is unknown
+    """
+    player_id = get_player_id(player_name)
+    if not player_id:
+        return None
+
+    split_url = (f"{MLB_API}/people/{player_id}/stats"
+                 "?stats=statSplits&group=hitting&sitCodes={sit}"
+                 f"&season={season}")
+
+    fetches = [
+        ('home_away', split_url.format(sit='h,a'), _parse_statsapi_splits),
+        # Both handedness splits come back from one sitCodes=vl,vr
+        # request; the parser fans them out to vs_rhp / vs_lhp below
+        ('vs_hand', split_url.format(sit='vl,vr'), _parse_statsapi_hand_splits),
+        # The two Savant CSVs ride the same pooled session as the
+        # StatsAPI calls, so the pair overlaps server-side processing
+        # and reuses one TCP/TLS connection per host
+        ('savant_season', _savant_url(season, player_id, 'name-stats'),
+         _parse_savant_season_csv),
+        ('savant_pitch_types', _savant_url(season, player_id, 'pitch_name'),
+         _parse_savant_pitch_csv),
+    ]
+
+    all_splits = {
+        'player': player_name,
+        'player_id': player_id,
+        'season': season,
+        'lastUpdated': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+    }
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = {
+            executor.submit(_cached_get, url, season): (key, parser)
+            for key, url, parser in fetches
+        }
+        for future in as_completed(futures):
+            key, parser = futures[future]
+            try:
+                response = future.result()
+                if response.status_code == 200:
+                    parsed = parser(response)
+                    if key == 'vs_hand':
+                        all_splits.update(parsed)
+                    else:
+                        all_splits[key] = parsed
+                else:
+                    logger.warning("Error fetching %s: status %s", key,
+                                   response.status_code)
+            except Exception as e:
+                logger.warning("Error fetching %s: %s", key, e)
+
+    return all_splits
+
+def save_player_splits(player_name, season, all_splits):
+    """
+    Save a player's complete splits to splits/<player>_<season>_complete.json.
+
+    Parameters:
+    - player_name (str): Full name of the player
+    - season (int): Season year
+    - all_splits (dict): Data from get_player_complete_splits
+    """
+    os.makedirs('splits', exist_ok=True)
+    filename = f"splits/{player_name.replace(' ', '_')}_{season}_complete.json"
+    try:
+        # Hash everything except lastUpdated (which changes every run,
+        # so hashing it would defeat the skip) and compare against the
+        # .sha sidecar: byte-identical data costs a read, not a rewrite
+        stable = {k: v for k, v in all_splits.items() if k != 'lastUpdated'}
+        digest = hashlib.blake2b(_canonical(stable), digest_size=16).hexdigest()
+        sha_path = filename + '.sha'
+        try:
+            with open(sha_path) as f:
+                if f.read() == digest:
+                    logger.debug("Splits unchanged, keeping %s", filename)
+                    return
+        except FileNotFoundError:
+            pass
+
+        # Write-then-rename so a crash mid-dump never leaves a
+        # truncated splits file behind. Binary mode: _dumps returns bytes
+        tmp_path = filename + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(_dumps(all_splits))
+        os.replace(tmp_path, filename)
+        with open(sha_path, 'w') as f:
+            f.write(digest)
+        logger.info("Saved complete splits to %s", filename)
+    except Exception as e:
+        logger.warning("Error saving complete splits: %s", e)
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+
+    name = input("Enter player name: ").strip()
+    year = input("Enter season year (default 2024): ").strip()
+    season = int(year) if year else 2024
+
+    splits = get_player_complete_splits(name, season)
+    if splits:
+        save_player_splits(name, season, splits)
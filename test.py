@@ -0,0 +1,41 @@
+import io
+import re
+
+import pandas as pd
+
+def parse_stats_table(data_string):
+    """
+    Parse a fixed-width stats table (header row plus data rows) into a
+    list of row dicts.
+
+    Column boundaries are derived once from where each header name
+    starts, then the whole body is handed to pandas.read_fwf so the C
+    tokenizer does the slicing and type conversion instead of a
+    Python-level slice/strip/convert per cell.
+
+    Parameters:
+    - data_string (str): Table text; first line is the header
+
+    Returns:
+    - list: One dict per data row keyed by column name
+    """
+    header, _, body = data_string.partition('\n')
+    matches = list(re.finditer(r'\S+', header))
+    if not matches:
+        return []
+    column_names = [m.group() for m in matches]
+    positions = [m.start() for m in matches]
+    colspecs = list(zip(positions, positions[1:] + [None]))
+
+    df = pd.read_fwf(io.StringIO(body), colspecs=colspecs, names=column_names)
+    return df.to_dict(orient='records')
+
+if __name__ == "__main__":
+    sample = (
+        "Rank Player           Team Value\n"
+        "1    Aaron Judge      NYY  0.322\n"
+        "2    Bobby Witt Jr.   KC   0.332\n"
+        "3    Vladimir Guerrero TOR 0.323\n"
+    )
+    for row in parse_stats_table(sample):
+        print(row)
@@ -0,0 +1,39 @@
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import api_get
+
+class _StubResponse:
+    def __init__(self, content):
+        self.content = content
+
+class _StubClient:
+    """Minimal httpx.AsyncClient stand-in serving canned payloads."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def get(self, url, params=None):
+        # A leftover placeholder means a path param was never
+        # interpolated — the KeyError regression this test pins down
+        assert '{' not in url, f"unformatted path param in {url}"
+        if 'search' in url:
+            return _StubResponse(b'{"people": [{"id": 99}]}')
+        return _StubResponse(b'{"people": [{"stats": []}]}')
+
+def test_async_example_completes_with_stubbed_client(monkeypatch):
+    monkeypatch.setattr(api_get.httpx, 'AsyncClient', _StubClient)
+    results = asyncio.run(
+        api_get.simple_get_example_async("Aaron Judge", 2024, verbose=False))
+    assert results is not None
+    assert len(results) == len(api_get._ENDPOINT_TEMPLATES)
+    assert all(summary.error is None for summary in results)